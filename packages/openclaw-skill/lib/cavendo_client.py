@@ -4,25 +4,90 @@ Cavendo Engine client wrapper with OpenClaw integration.
 Provides a configured CavendoClient instance with settings from .env.
 """
 
+import atexit
+import importlib.util
 import os
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from cavendo import CavendoClient
 
-# Load environment variables from .env in skill directory
 SKILL_DIR = Path(__file__).parent.parent
-load_dotenv(SKILL_DIR / ".env")
+ENV_FILE = SKILL_DIR / ".env"
+ENV_CACHE_FILE = SKILL_DIR / ".env.cache.py"
+
+_DOTENV_LOADED = False
+
+# Clients shared across get_client() calls, keyed by (url, api_key)
+_CLIENTS = {}
+
+def _load_env_fast():
+    """
+    Load .env values into os.environ, using a compiled module cache when fresh.
+
+    The cache is a Python module next to .env holding the parsed values as a
+    literal dict, along with the st_mtime_ns and st_size of the .env it was
+    built from. It is used only while both still match .env exactly;
+    otherwise .env is reparsed and the cache rewritten. Variables already set
+    in the process environment are never overridden.
+    """
+    try:
+        env_stat = os.stat(ENV_FILE)
+    except OSError:
+        return
+    # Exact match rather than "cache is newer": an .env rewritten within the
+    # same mtime tick, or restored with an older mtime, must not reuse it.
+    source = (env_stat.st_mtime_ns, env_stat.st_size)
+
+    values = None
+    try:
+        spec = importlib.util.spec_from_file_location("_cavendo_env_cache", ENV_CACHE_FILE)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        if module.SOURCE == source:
+            values = module.ENV
+    except Exception:
+        values = None
+
+    if values is None:
+        values = {k: v for k, v in dotenv_values(ENV_FILE).items() if v is not None}
+        try:
+            tmp_path = ENV_CACHE_FILE.with_name(ENV_CACHE_FILE.name + ".tmp")
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                f.write("# Generated from .env - do not edit\n")
+                f.write(f"SOURCE = {source!r}\n")
+                f.write(f"ENV = {values!r}\n")
+            os.replace(tmp_path, ENV_CACHE_FILE)
+        except OSError:
+            pass
+
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+
+def _ensure_dotenv():
+    """Load .env from the skill directory once, on first use."""
+    global _DOTENV_LOADED
+    if _DOTENV_LOADED:
+        return
+    _load_env_fast()
+    _DOTENV_LOADED = True
 
 def get_client():
     """
     Get configured Cavendo Engine client.
     
+    The client is created once per (url, api_key) and reused by later calls,
+    so scripts share its connection pool. Closing it (e.g. via ``with``) only
+    releases the current connections; the next request reopens them.
+    
     Returns:
         CavendoClient: Configured client instance
         
     Raises:
         ValueError: If required environment variables are missing
     """
+    _ensure_dotenv()
     url = os.getenv("CAVENDO_URL")
     api_key = os.getenv("CAVENDO_AGENT_KEY")
     
@@ -32,32 +97,51 @@ def get_client():
     if not api_key:
         raise ValueError("CAVENDO_AGENT_KEY not set in .env")
     
-    return CavendoClient(url=url, api_key=api_key)
+    key = (url, api_key)
+    client = _CLIENTS.get(key)
+    if client is None:
+        client = CavendoClient(url=url, api_key=api_key)
+        _CLIENTS[key] = client
+        atexit.register(client.close)
+    return client
 
+@lru_cache(maxsize=1)
 def should_notify():
     """Check if notifications are enabled."""
+    _ensure_dotenv()
     return os.getenv("CAVENDO_NOTIFY_ON_SUBMIT", "true").lower() == "true"
 
+@lru_cache(maxsize=1)
 def get_notify_channel():
     """Get notification channel (signal, slack, etc.)."""
+    _ensure_dotenv()
     return os.getenv("CAVENDO_NOTIFY_CHANNEL", "signal")
 
+@lru_cache(maxsize=1)
 def get_notify_target():
     """Get notification target (phone number, channel ID, etc.)."""
+    _ensure_dotenv()
     return os.getenv("CAVENDO_NOTIFY_TARGET")
 
+@lru_cache(maxsize=1)
 def should_auto_claim():
     """Check if auto-claim is enabled."""
+    _ensure_dotenv()
     return os.getenv("CAVENDO_AUTO_CLAIM", "true").lower() == "true"
 
+@lru_cache(maxsize=1)
 def get_auto_claim_priority_min():
     """Get minimum priority for auto-claim (1=high, higher numbers = lower priority)."""
+    _ensure_dotenv()
     return int(os.getenv("CAVENDO_AUTO_CLAIM_PRIORITY_MIN", "2"))
 
+@lru_cache(maxsize=1)
 def get_max_concurrent():
     """Get maximum concurrent tasks."""
+    _ensure_dotenv()
     return int(os.getenv("CAVENDO_MAX_CONCURRENT", "3"))
 
+@lru_cache(maxsize=8)
 def get_model_for_priority(priority):
     """
     Get AI model to use based on task priority.
@@ -68,9 +152,23 @@ def get_model_for_priority(priority):
     Returns:
         str: Model identifier (e.g., "anthropic/claude-sonnet-4-6")
     """
+    _ensure_dotenv()
     if priority == 1:
         return os.getenv("CAVENDO_MODEL_HIGH", "anthropic/claude-sonnet-4-6")
     elif priority == 2:
         return os.getenv("CAVENDO_MODEL_MEDIUM", "anthropic/claude-haiku-4-5")
     else:
         return os.getenv("CAVENDO_MODEL_LOW", "anthropic/claude-haiku-4-5")
+
+def _reset_config_cache():
+    """Clear cached settings so the next lookup re-reads the environment."""
+    for getter in (
+        should_notify,
+        get_notify_channel,
+        get_notify_target,
+        should_auto_claim,
+        get_auto_claim_priority_min,
+        get_max_concurrent,
+        get_model_for_priority,
+    ):
+        getter.cache_clear()
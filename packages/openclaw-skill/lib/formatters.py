@@ -5,6 +5,17 @@ Provides functions to format tasks, deliverables, and other objects
 for display in OpenClaw conversations.
 """
 
+_PENDING_STATUSES = frozenset(("pending", "assigned"))
+
+# Display labels for priorities 1-4, indexed by priority - 1
+_PRIORITY_LABELS = ("🔴 High", "🟡 Medium", "🟢 Low", "⚪ Minimal")
+
+_TASK_ROW_TEMPLATE = (
+    "**{i}. #{id}: {title}**\n"
+    "   Priority: {priority}\n"
+    "   Status: {status}{desc}{due}\n"
+)
+
 def format_task_list(tasks, format="brief"):
     """
     Format a list of tasks for display.
@@ -26,57 +37,66 @@ def format_task_list(tasks, format="brief"):
 
 def _format_task_list_brief(tasks):
     """Format tasks as brief list."""
-    lines = [f"Found {len(tasks)} task(s):\n"]
-    
-    # Group by priority
-    high = [t for t in tasks if t.priority == 1]
-    medium = [t for t in tasks if t.priority == 2]
-    low = [t for t in tasks if t.priority == 3 or t.priority == 4]
-    
-    if high:
-        lines.append("**High Priority:**")
-        for task in high:
-            lines.append(f"  • #{task.id}: {task.title}")
-    
-    if medium:
-        lines.append("\n**Medium Priority:**")
-        for task in medium:
-            lines.append(f"  • #{task.id}: {task.title}")
-    
-    if low:
-        lines.append("\n**Low Priority:**")
-        for task in low:
-            lines.append(f"  • #{task.id}: {task.title}")
+    lines = [f"Found {len(tasks)} task(s):", ""]
+    
+    # Group by priority in a single pass
+    high, medium, low = [], [], []
+    for t in tasks:
+        p = t.priority
+        if p == 1:
+            high.append(t)
+        elif p == 2:
+            medium.append(t)
+        elif p == 3 or p == 4:
+            low.append(t)
+    
+    first = True
+    for heading, group in (
+        ("**High Priority:**", high),
+        ("**Medium Priority:**", medium),
+        ("**Low Priority:**", low),
+    ):
+        if not group:
+            continue
+        if not first:
+            lines.append("")
+        first = False
+        lines.append(heading)
+        lines.extend([f"  • #{task.id}: {task.title}" for task in group])
     
     return "\n".join(lines)
 
 def _format_task_list_detailed(tasks):
     """Format tasks with full details."""
-    lines = [f"Found {len(tasks)} task(s):\n"]
+    lines = [f"Found {len(tasks)} task(s):", ""]
     
     for i, task in enumerate(tasks, 1):
-        priority_label = _get_priority_label(task.priority)
-        lines.append(f"**{i}. #{task.id}: {task.title}**")
-        lines.append(f"   Priority: {priority_label}")
-        lines.append(f"   Status: {task.status}")
-        if hasattr(task, 'description') and task.description:
-            desc = task.description[:100] + "..." if len(task.description) > 100 else task.description
-            lines.append(f"   Description: {desc}")
-        if hasattr(task, 'due_date') and task.due_date:
-            lines.append(f"   Due: {task.due_date}")
-        lines.append("")  # Blank line between tasks
+        desc = due = ""
+        description = getattr(task, 'description', None)
+        if description:
+            text = description[:100] + "..." if len(description) > 100 else description
+            desc = f"\n   Description: {text}"
+        due_date = getattr(task, 'due_date', None)
+        if due_date:
+            due = f"\n   Due: {due_date}"
+        # One string per task; the trailing newline leaves a blank line between tasks
+        lines.append(_TASK_ROW_TEMPLATE.format_map({
+            "i": i,
+            "id": task.id,
+            "title": task.title,
+            "priority": _get_priority_label(task.priority),
+            "status": task.status,
+            "desc": desc,
+            "due": due,
+        }))
     
     return "\n".join(lines)
 
 def _get_priority_label(priority):
     """Convert priority number to label."""
-    labels = {
-        1: "🔴 High",
-        2: "🟡 Medium",
-        3: "🟢 Low",
-        4: "⚪ Minimal"
-    }
-    return labels.get(priority, f"Priority {priority}")
+    if isinstance(priority, int) and 1 <= priority <= 4:
+        return _PRIORITY_LABELS[priority - 1]
+    return f"Priority {priority}"
 
 def format_deliverable(deliverable):
     """
@@ -94,11 +114,13 @@ def format_deliverable(deliverable):
         f"Status: {deliverable.status}",
     ]
     
-    if hasattr(deliverable, 'summary') and deliverable.summary:
-        lines.append(f"\n**Summary:**\n{deliverable.summary}")
+    summary = getattr(deliverable, 'summary', None)
+    if summary:
+        lines.append(f"\n**Summary:**\n{summary}")
     
-    if hasattr(deliverable, 'content') and deliverable.content:
-        content_preview = deliverable.content[:500] + "..." if len(deliverable.content) > 500 else deliverable.content
+    content = getattr(deliverable, 'content', None)
+    if content:
+        content_preview = content[:500] + "..." if len(content) > 500 else content
         lines.append(f"\n**Content Preview:**\n{content_preview}")
     
     if hasattr(deliverable, 'created_at'):
@@ -118,9 +140,15 @@ def format_sprint_summary(sprint, tasks):
         str: Formatted summary
     """
     total = len(tasks)
-    completed = len([t for t in tasks if t.status == "completed"])
-    in_progress = len([t for t in tasks if t.status == "in_progress"])
-    pending = len([t for t in tasks if t.status in ("pending", "assigned")])
+    completed = in_progress = pending = 0
+    for t in tasks:
+        status = t.status
+        if status == "completed":
+            completed += 1
+        elif status == "in_progress":
+            in_progress += 1
+        elif status in _PENDING_STATUSES:
+            pending += 1
     
     lines = [
         f"**Sprint: {sprint.name}**",
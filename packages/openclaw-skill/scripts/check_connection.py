@@ -25,7 +25,7 @@ def main():
             print("✅ Connected to Cavendo Engine")
             print(f"Authenticated as: {me.name}")
             print(f"Agent/User ID: {me.id}")
-            print(f"Type: {me.type if hasattr(me, 'type') else 'User'}")
+            print(f"Type: {getattr(me, 'type', 'User')}")
             
             return 0
             
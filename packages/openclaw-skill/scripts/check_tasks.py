@@ -8,6 +8,8 @@ Usage:
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
 
 # Add parent directory to path for lib imports
@@ -16,6 +18,19 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from lib.cavendo_client import get_client
 from lib.formatters import format_task_list
 
+def fetch_tasks(client, statuses):
+    """Fetch tasks for several statuses in parallel and merge the results."""
+    if len(statuses) == 1:
+        return client.tasks.list_all(status=statuses[0])
+    with ThreadPoolExecutor(max_workers=min(4, len(statuses))) as executor:
+        results = executor.map(lambda status: client.tasks.list_all(status=status), statuses)
+        return list(chain.from_iterable(results))
+
+def _project_matches(task, project_filter):
+    """Check whether a task's project name contains the (lowercased) filter."""
+    project_name = getattr(task, 'project_name', '')
+    return bool(project_name) and project_filter in project_name.lower()
+
 def main():
     """Check for pending tasks."""
     parser = argparse.ArgumentParser(description="Check Cavendo Engine tasks")
@@ -25,23 +40,26 @@ def main():
     parser.add_argument("--project", help="Filter by project name or ID")
     args = parser.parse_args()
     
+    # Parse filters once, before any network calls
+    statuses = tuple(status.strip().lower() for status in args.status.split(","))
+    try:
+        priorities = frozenset(int(p) for p in args.priority.split(",")) if args.priority else None
+    except ValueError:
+        parser.error("--priority must be a comma-separated list of integers")
+    project_filter = args.project.lower() if args.project else None
+    
     try:
         with get_client() as client:
-            # Get tasks
-            statuses = args.status.split(",")
-            tasks = []
-            for status in statuses:
-                tasks.extend(client.tasks.list_mine(status=status.strip()))
-            
-            # Filter by priority if specified
-            if args.priority:
-                priorities = [int(p) for p in args.priority.split(",")]
-                tasks = [t for t in tasks if t.priority in priorities]
+            # Get tasks (one request per status, issued in parallel over the shared pool)
+            tasks = fetch_tasks(client, statuses)
             
-            # Filter by project if specified
-            if args.project:
-                project_filter = args.project.lower()
-                tasks = [t for t in tasks if getattr(t, 'project_name', '') and project_filter in t.project_name.lower()]
+            # Filter by priority and/or project in a single pass
+            if priorities is not None or project_filter is not None:
+                tasks = [
+                    t for t in tasks
+                    if (priorities is None or t.priority in priorities)
+                    and (project_filter is None or _project_matches(t, project_filter))
+                ]
             
             if not tasks:
                 print("No tasks found matching criteria.")
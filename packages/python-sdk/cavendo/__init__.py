@@ -38,6 +38,7 @@ from .exceptions import (
     ValidationError,
 )
 from .knowledge import KnowledgeAPI
+from .rate_limit import AdaptiveRateLimiter
 from .tasks import TasksAPI
 from .types import (
     ActionItem,
@@ -69,6 +70,8 @@ __all__ = [
     "DeliverablesAPI",
     "KnowledgeAPI",
     "WebhooksAPI",
+    # Rate limiting
+    "AdaptiveRateLimiter",
     # Types
     "ActionItem",
     "Agent",
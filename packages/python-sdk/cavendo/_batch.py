@@ -0,0 +1,38 @@
+"""
+Helpers for issuing many SDK calls concurrently.
+
+Used by the ``*_many_async`` methods on the API classes.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Default cap on in-flight requests for batch helpers. Matches the number of
+# keep-alive connections in the client's default pool so batches reuse sockets
+# instead of opening extra ones.
+DEFAULT_MAX_CONCURRENCY = 20
+
+
+async def gather_bounded(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[R]:
+    """
+    Await ``func(item)`` for every item with at most ``max_concurrency`` in flight.
+
+    Results are returned in the same order as ``items``. The first exception
+    raised propagates, as with ``asyncio.gather``.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(item: T) -> R:
+        async with semaphore:
+            return await func(item)
+
+    return list(await asyncio.gather(*(run_one(item) for item in items)))
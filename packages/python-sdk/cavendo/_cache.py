@@ -0,0 +1,97 @@
+"""
+Memoization helpers for read-mostly SDK lookups.
+
+Used by TasksAPI to memoize get()/context() results between writes and to
+share identical requests that are already in flight.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe mapping whose entries expire ``ttl`` seconds after insertion.
+
+    When more than ``maxsize`` entries are stored, the least recently used
+    are evicted first. A non-positive ``ttl`` disables caching entirely.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 512) -> None:
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._data: dict[K, tuple[float, V]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            # Move to the end so that dict order tracks recency for eviction
+            self._data[key] = self._data.pop(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store ``value`` under ``key`` (no-op when caching is disabled)."""
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            # Re-insert so that dict order tracks recency for eviction
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            while len(self._data) > self._maxsize:
+                del self._data[next(iter(self._data))]
+
+    def pop(self, key: K) -> None:
+        """Remove ``key`` if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Coalesces concurrent async calls that share a key.
+
+    The first caller for a key starts the call; callers arriving before it
+    finishes await the same result (or exception) instead of issuing their
+    own. Cancelling one caller does not cancel the shared call.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, "asyncio.Future[V]"] = {}
+
+    async def run(self, key: K, func: Callable[[], Awaitable[V]]) -> V:
+        """Return the result of ``func()``, sharing any in-flight call for ``key``."""
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._inflight[key] = future
+            future.add_done_callback(lambda done: self._discard(key, done))
+        return await asyncio.shield(future)
+
+    def forget(self, key: Optional[K] = None) -> None:
+        """Make later callers start a new call for ``key`` (or for every key if None)."""
+        if key is None:
+            self._inflight.clear()
+        else:
+            self._inflight.pop(key, None)
+
+    def _discard(self, key: K, done: "asyncio.Future[V]") -> None:
+        if self._inflight.get(key) is done:
+            del self._inflight[key]
@@ -0,0 +1,91 @@
+"""
+Background delivery of task progress entries.
+
+Used by TasksAPI.start_progress_buffer() so that agents can record progress
+without waiting for each POST to complete.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+# (task_id, request body); None tells the flusher to finish and exit.
+_Entry = Optional[tuple[int, dict[str, Any]]]
+
+
+class ProgressBuffer:
+    """
+    Queue of progress entries drained by a background asyncio task.
+
+    Entries are collected for up to ``flush_interval`` seconds or until
+    ``max_batch`` are queued, then sent. Entries for different tasks are sent
+    concurrently; entries for the same task are sent in the order they were
+    queued. The first delivery error is re-raised by close().
+
+    Must be created while an event loop is running.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[int, dict[str, Any]], Awaitable[Any]],
+        flush_interval: float,
+        max_batch: int,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self._send = send
+        self._flush_interval = flush_interval
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[_Entry] = asyncio.Queue()
+        self._error: Optional[BaseException] = None
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def put(self, task_id: int, body: dict[str, Any]) -> None:
+        """Queue a progress entry for delivery."""
+        self._queue.put_nowait((task_id, body))
+
+    async def close(self) -> None:
+        """Send everything still queued, stop the flusher, and raise any delivery error."""
+        self._queue.put_nowait(None)
+        await self._task
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        closing = False
+        while not closing:
+            batch: list[tuple[int, dict[str, Any]]] = []
+            entry = await self._queue.get()
+            deadline = loop.time() + self._flush_interval
+            while True:
+                if entry is None:
+                    closing = True
+                    break
+                batch.append(entry)
+                timeout = deadline - loop.time()
+                if len(batch) >= self._max_batch or timeout <= 0:
+                    break
+                try:
+                    entry = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            if batch:
+                await self._send_batch(batch)
+
+    async def _send_batch(self, batch: list[tuple[int, dict[str, Any]]]) -> None:
+        by_task: dict[int, list[dict[str, Any]]] = {}
+        for task_id, body in batch:
+            by_task.setdefault(task_id, []).append(body)
+
+        async def send_in_order(task_id: int, bodies: list[dict[str, Any]]) -> None:
+            for body in bodies:
+                await self._send(task_id, body)
+
+        results = await asyncio.gather(
+            *(send_in_order(task_id, bodies) for task_id, bodies in by_task.items()),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException) and self._error is None:
+                self._error = result
@@ -6,9 +6,18 @@ interacting with the Cavendo Engine API.
 """
 
 import asyncio
+import dataclasses
+import functools
+import importlib
+import importlib.util
+import json as _json
 import os
+import random
+import threading
 import time
-from typing import Any, Optional
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Mapping, Optional, Union
 
 import httpx
 
@@ -25,10 +34,79 @@ from .exceptions import (
     ValidationError,
 )
 from .knowledge import KnowledgeAPI
+from .rate_limit import AdaptiveRateLimiter
 from .tasks import TasksAPI
 from .types import Agent
 from .webhooks import WebhooksAPI
 
+# HTTP/2 requires the optional h2 package (pip install cavendo-engine[http2])
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _json_default(value: Any) -> Any:
+    """Encode enums, datetimes and dataclasses that the stdlib JSON encoder can't handle."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _stdlib_json_dumps(value: Any) -> bytes:
+    """Encode a request body to compact JSON bytes with the stdlib encoder."""
+    return _json.dumps(value, default=_json_default, separators=(",", ":")).encode()
+
+
+# Use orjson for request/response JSON when installed (pip install cavendo-engine[speedups]).
+# Both parsers accept raw bytes and raise ValueError subclasses on invalid input;
+# orjson natively encodes enums, datetimes and dataclasses.
+_json_loads: Callable[[bytes], Any]
+_json_dumps: Callable[[Any], bytes]
+try:
+    _orjson = importlib.import_module("orjson")
+    _json_loads = _orjson.loads
+    _json_dumps = functools.partial(_orjson.dumps, option=_orjson.OPT_NON_STR_KEYS)
+except ImportError:  # pragma: no cover - depends on installed extras
+    _json_loads = _json.loads
+    _json_dumps = _stdlib_json_dumps
+
+# Connection pool settings shared by the sync and async HTTP clients.
+# Keep-alive connections are reused across calls so that chatty agent loops
+# (next -> claim -> context -> submit) don't pay a TCP/TLS handshake per request.
+_DEFAULT_POOL_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=50,
+    keepalive_expiry=30.0,
+)
+
+# Unauthenticated, unthrottled endpoint used by connect() to warm the pool.
+_HEALTH_PATH = "/health"
+
+
+def _health_request(client: Union[httpx.Client, httpx.AsyncClient]) -> httpx.Request:
+    """Build the connect() health check without the client's auth header."""
+    request = client.build_request("HEAD", _HEALTH_PATH)
+    # The endpoint needs no key, so keep the credential off a request that doesn't use it
+    del request.headers["X-Agent-Key"]
+    return request
+
+
+# Backoff delays (seconds) indexed by retry attempt; the last entry is reused
+# for any further attempts.
+_BACKOFF = (1, 2, 4, 8, 16)
+
+# Status codes whose errors take only (message, status_code, body).
+_SIMPLE_ERRORS: dict[int, type[CavendoError]] = {
+    401: AuthenticationError,
+    403: AuthorizationError,
+    404: NotFoundError,
+}
+
+# Client errors that are never retried.
+_NON_RETRYABLE_ERRORS = (AuthenticationError, AuthorizationError, NotFoundError, ValidationError)
+
 
 class CavendoClient:
     """
@@ -79,6 +157,12 @@ class CavendoClient:
         api_key: Optional[str] = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        retry_deadline: Optional[float] = None,
+        pool_size: Optional[int] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        cache_ttl: float = 0.0,
+        revalidate: bool = False,
+        preconnect: bool = False,
     ) -> None:
         """
         Initialize the Cavendo client.
@@ -91,6 +175,22 @@ class CavendoClient:
                      Falls back to CAVENDO_AGENT_KEY environment variable.
             timeout: Request timeout in seconds (default 30).
             max_retries: Maximum number of retries for failed requests (default 3).
+            retry_deadline: Total seconds a request may spend across all attempts
+                            and backoff sleeps. A retry whose backoff would end
+                            past this is not attempted. Defaults to ``timeout``.
+            pool_size: Maximum number of pooled connections per HTTP client, all of
+                       which are kept alive between requests. Defaults to 50
+                       connections with up to 20 kept alive.
+            rate_limiter: Optional AdaptiveRateLimiter that throttles requests
+                          based on server rate-limit headers and error rates.
+            cache_ttl: Seconds to cache tasks.get()/tasks.context() results per
+                       task (default 0, disabled). Writes through this client
+                       invalidate the affected task.
+            revalidate: Remember the ETag of recent tasks.get()/tasks.context()
+                        responses and send If-None-Match, so an unchanged task is
+                        answered with 304 and not decoded again (default False).
+            preconnect: Open a pooled connection in a background thread right
+                        away, so the first request skips the TCP/TLS handshake.
 
         Raises:
             ValueError: If api_key is not provided and CAVENDO_AGENT_KEY is not set.
@@ -106,9 +206,30 @@ class CavendoClient:
 
         self._timeout = timeout
         self._max_retries = max_retries
+        self._retry_deadline = timeout if retry_deadline is None else retry_deadline
+        self._rate_limiter = rate_limiter
+        self._cache_ttl = cache_ttl
+        self._revalidate = revalidate
+        self._limits = (
+            _DEFAULT_POOL_LIMITS
+            if pool_size is None
+            else httpx.Limits(
+                max_keepalive_connections=pool_size,
+                max_connections=pool_size,
+                keepalive_expiry=_DEFAULT_POOL_LIMITS.keepalive_expiry,
+            )
+        )
+
+        # Default headers are static for the lifetime of the client
+        self._headers: dict[str, str] = {
+            "X-Agent-Key": self._api_key,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
 
-        # Initialize sync client
+        # Initialize sync client (created lazily; the lock lets threads share it)
         self._sync_client: Optional[httpx.Client] = None
+        self._sync_client_lock = threading.Lock()
 
         # Initialize async client
         self._async_client: Optional[httpx.AsyncClient] = None
@@ -119,15 +240,24 @@ class CavendoClient:
         self.knowledge = KnowledgeAPI(self)
         self.webhooks = WebhooksAPI(self)
 
+        if preconnect:
+            threading.Thread(target=self.connect, daemon=True).start()
+
     def _get_sync_client(self) -> httpx.Client:
         """Get or create the synchronous HTTP client."""
-        if self._sync_client is None:
-            self._sync_client = httpx.Client(
-                base_url=self._url,
-                timeout=self._timeout,
-                headers=self._get_headers(),
-            )
-        return self._sync_client
+        client = self._sync_client
+        if client is None:
+            with self._sync_client_lock:
+                client = self._sync_client
+                if client is None:
+                    client = self._sync_client = httpx.Client(
+                        base_url=self._url,
+                        timeout=self._timeout,
+                        headers=self._headers,
+                        limits=self._limits,
+                        http2=_HTTP2_AVAILABLE,
+                    )
+        return client
 
     def _get_async_client(self) -> httpx.AsyncClient:
         """Get or create the asynchronous HTTP client."""
@@ -135,7 +265,9 @@ class CavendoClient:
             self._async_client = httpx.AsyncClient(
                 base_url=self._url,
                 timeout=self._timeout,
-                headers=self._get_headers(),
+                headers=self._headers,
+                limits=self._limits,
+                http2=_HTTP2_AVAILABLE,
             )
         return self._async_client
 
@@ -146,11 +278,7 @@ class CavendoClient:
         Returns:
             Dictionary of HTTP headers with authentication and content type.
         """
-        return {
-            "X-Agent-Key": self._api_key or "",
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        return self._headers
 
     def _handle_response_error(self, response: httpx.Response) -> None:
         """
@@ -168,7 +296,8 @@ class CavendoClient:
             ServerError: For 5xx responses.
             CavendoError: For other error responses.
         """
-        if response.is_success:
+        # 304 answers a conditional request (If-None-Match): the caller's copy is current
+        if response.is_success or response.status_code == 304:
             return
 
         status_code = response.status_code
@@ -179,12 +308,9 @@ class CavendoClient:
             body = None
             message = response.text or f"HTTP {status_code}"
 
-        if status_code == 401:
-            raise AuthenticationError(message, status_code, body)
-        elif status_code == 403:
-            raise AuthorizationError(message, status_code, body)
-        elif status_code == 404:
-            raise NotFoundError(message, status_code, body)
+        error_class = _SIMPLE_ERRORS.get(status_code)
+        if error_class is not None:
+            raise error_class(message, status_code, body)
         elif status_code in (400, 422):
             errors = body.get("errors") if body else None
             raise ValidationError(message, status_code, body, errors)
@@ -201,12 +327,55 @@ class CavendoClient:
         else:
             raise CavendoError(message, status_code, body)
 
+    def _classify_exception(
+        self, error: Exception, retries: int, deadline: float = float("inf")
+    ) -> tuple[bool, float]:
+        """
+        Decide whether a failed request should be retried.
+
+        Shared by the sync and async request loops, which only differ in how
+        they sleep between attempts.
+
+        Args:
+            error: The exception raised by the request attempt.
+            retries: Number of retries already performed.
+            deadline: time.monotonic() value after which no retry may start.
+
+        Returns:
+            Tuple of (should_retry, wait_time_in_seconds).
+
+        Raises:
+            CavendoConnectionError: If unable to connect.
+            CavendoTimeoutError: If the request timed out.
+        """
+        if isinstance(error, httpx.ConnectError):
+            raise CavendoConnectionError(f"Failed to connect to {self._url}: {error}") from error
+        if isinstance(error, httpx.TimeoutException):
+            raise CavendoTimeoutError(f"Request timed out: {error}") from error
+
+        # Don't retry client errors, or anything once retries are exhausted
+        if isinstance(error, _NON_RETRYABLE_ERRORS) or retries >= self._max_retries:
+            return False, 0.0
+
+        # Use retry_after if provided, otherwise jittered exponential backoff
+        if isinstance(error, RateLimitError) and error.retry_after:
+            wait_time = float(error.retry_after)
+        else:
+            backoff = _BACKOFF[min(retries, len(_BACKOFF) - 1)]
+            wait_time = backoff + random.uniform(0, 0.25 * retries)
+
+        # Give up rather than sleep past the overall deadline
+        if time.monotonic() + wait_time > deadline:
+            return False, 0.0
+        return True, wait_time
+
     def _request(
         self,
         method: str,
         path: str,
-        params: Optional[dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> httpx.Response:
         """
         Make a synchronous HTTP request.
@@ -215,10 +384,11 @@ class CavendoClient:
             method: HTTP method (GET, POST, PATCH, DELETE).
             path: API path (e.g., /api/agents/me).
             params: Query parameters.
-            json: JSON body for POST/PATCH requests.
+            json: JSON body for POST/PATCH requests (encoded once, reused on retry).
+            headers: Extra request headers (e.g. If-None-Match).
 
         Returns:
-            The HTTP response.
+            The HTTP response. A 304 Not Modified response is returned as-is.
 
         Raises:
             ConnectionError: If unable to connect.
@@ -226,50 +396,43 @@ class CavendoClient:
             Various CavendoError subclasses for API errors.
         """
         client = self._get_sync_client()
+        content = _json_dumps(json) if json is not None else None
 
+        limiter = self._rate_limiter
+        deadline = time.monotonic() + self._retry_deadline
         retries = 0
-        last_error: Optional[Exception] = None
-
-        while retries <= self._max_retries:
+        while True:
             try:
-                response = client.request(method, path, params=params, json=json)
+                if limiter is None:
+                    response = client.request(
+                        method, path, params=params, content=content, headers=headers
+                    )
+                else:
+                    limiter.acquire()
+                    try:
+                        response = client.request(
+                            method, path, params=params, content=content, headers=headers
+                        )
+                    except BaseException:
+                        limiter.release()
+                        raise
+                    limiter.release(response)
                 self._handle_response_error(response)
                 return response
-            except (AuthenticationError, AuthorizationError, NotFoundError, ValidationError):
-                # Don't retry client errors
-                raise
-            except RateLimitError as e:
-                if retries >= self._max_retries:
-                    raise
-                # Use retry_after if provided, otherwise exponential backoff
-                wait_time = e.retry_after if e.retry_after else (2 ** retries)
-                time.sleep(wait_time)
-                last_error = e
-                retries += 1
-            except httpx.ConnectError as e:
-                raise CavendoConnectionError(f"Failed to connect to {self._url}: {e}") from e
-            except httpx.TimeoutException as e:
-                raise CavendoTimeoutError(f"Request timed out: {e}") from e
-            except (ServerError, CavendoError) as e:
-                if retries >= self._max_retries:
+            except (httpx.ConnectError, httpx.TimeoutException, CavendoError) as e:
+                should_retry, wait_time = self._classify_exception(e, retries, deadline)
+                if not should_retry:
                     raise
-                # Exponential backoff for server errors
-                wait_time = 2 ** retries
                 time.sleep(wait_time)
-                last_error = e
                 retries += 1
 
-        # Should not reach here, but just in case
-        if last_error:
-            raise last_error
-        raise CavendoError("Request failed after retries")
-
     async def _request_async(
         self,
         method: str,
         path: str,
-        params: Optional[dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
     ) -> httpx.Response:
         """
         Make an asynchronous HTTP request.
@@ -278,10 +441,11 @@ class CavendoClient:
             method: HTTP method (GET, POST, PATCH, DELETE).
             path: API path (e.g., /api/agents/me).
             params: Query parameters.
-            json: JSON body for POST/PATCH requests.
+            json: JSON body for POST/PATCH requests (encoded once, reused on retry).
+            headers: Extra request headers (e.g. If-None-Match).
 
         Returns:
-            The HTTP response.
+            The HTTP response. A 304 Not Modified response is returned as-is.
 
         Raises:
             ConnectionError: If unable to connect.
@@ -289,56 +453,51 @@ class CavendoClient:
             Various CavendoError subclasses for API errors.
         """
         client = self._get_async_client()
+        content = _json_dumps(json) if json is not None else None
 
+        limiter = self._rate_limiter
+        deadline = time.monotonic() + self._retry_deadline
         retries = 0
-        last_error: Optional[Exception] = None
-
-        while retries <= self._max_retries:
+        while True:
             try:
-                response = await client.request(method, path, params=params, json=json)
+                if limiter is None:
+                    response = await client.request(
+                        method, path, params=params, content=content, headers=headers
+                    )
+                else:
+                    await limiter.acquire_async()
+                    try:
+                        response = await client.request(
+                            method, path, params=params, content=content, headers=headers
+                        )
+                    except BaseException:
+                        limiter.release()
+                        raise
+                    limiter.release(response)
                 self._handle_response_error(response)
                 return response
-            except (AuthenticationError, AuthorizationError, NotFoundError, ValidationError):
-                # Don't retry client errors
-                raise
-            except RateLimitError as e:
-                if retries >= self._max_retries:
-                    raise
-                # Use retry_after if provided, otherwise exponential backoff
-                wait_time = e.retry_after if e.retry_after else (2 ** retries)
-                await asyncio.sleep(wait_time)
-                last_error = e
-                retries += 1
-            except httpx.ConnectError as e:
-                raise CavendoConnectionError(f"Failed to connect to {self._url}: {e}") from e
-            except httpx.TimeoutException as e:
-                raise CavendoTimeoutError(f"Request timed out: {e}") from e
-            except (ServerError, CavendoError) as e:
-                if retries >= self._max_retries:
+            except (httpx.ConnectError, httpx.TimeoutException, CavendoError) as e:
+                should_retry, wait_time = self._classify_exception(e, retries, deadline)
+                if not should_retry:
                     raise
-                # Exponential backoff for server errors
-                wait_time = 2 ** retries
                 await asyncio.sleep(wait_time)
-                last_error = e
                 retries += 1
 
-        if last_error:
-            raise last_error
-        raise CavendoError("Request failed after retries")
-
     def _extract_data(self, response: httpx.Response) -> Any:
         """
         Extract data from API response.
 
         The Cavendo API wraps responses in {success: true, data: ...} format.
         This method extracts the data field or returns the raw response if
-        not wrapped.
+        not wrapped. Empty responses (e.g. 204 No Content) yield None.
 
         Raises:
             ServerError: If the response contains invalid JSON.
         """
+        if response.status_code == 204 or not response.content:
+            return None
         try:
-            body = response.json()
+            body = _json_loads(response.content)
         except ValueError as e:
             raise ServerError(f"Invalid JSON response from server: {e}") from e
         if isinstance(body, dict) and "data" in body:
@@ -349,7 +508,7 @@ class CavendoClient:
         self,
         method: str,
         path: str,
-        params: Optional[dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
     ) -> Any:
         """Make a request and return extracted JSON data."""
@@ -360,7 +519,7 @@ class CavendoClient:
         self,
         method: str,
         path: str,
-        params: Optional[dict[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
         json: Optional[dict[str, Any]] = None,
     ) -> Any:
         """Make an async request and return extracted JSON data."""
@@ -379,8 +538,7 @@ class CavendoClient:
             >>> print(f"Agent: {agent.name}")
             >>> print(f"Scopes: {', '.join(agent.scopes)}")
         """
-        response = self._request("GET", "/api/agents/me")
-        return Agent.from_dict(self._extract_data(response))
+        return Agent.from_dict(self._request_json("GET", "/api/agents/me"))
 
     async def me_async(self) -> Agent:
         """
@@ -388,8 +546,33 @@ class CavendoClient:
 
         See me() for documentation.
         """
-        response = await self._request_async("GET", "/api/agents/me")
-        return Agent.from_dict(self._extract_data(response))
+        return Agent.from_dict(await self._request_json_async("GET", "/api/agents/me"))
+
+    def connect(self) -> None:
+        """
+        Open a pooled connection to the server ahead of the first API call.
+
+        Sends a HEAD request to the health endpoint, without the agent key, so
+        that DNS lookup and the TCP/TLS handshake happen now rather than on the
+        first real request. Errors are ignored; API calls connect as usual.
+        """
+        client = self._get_sync_client()
+        try:
+            client.send(_health_request(client))
+        except httpx.HTTPError:
+            pass
+
+    async def aconnect(self) -> None:
+        """
+        Async version of connect().
+
+        Warms the async client's connection pool.
+        """
+        client = self._get_async_client()
+        try:
+            await client.send(_health_request(client))
+        except httpx.HTTPError:
+            pass
 
     def close(self) -> None:
         """
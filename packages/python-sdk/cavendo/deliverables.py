@@ -6,12 +6,145 @@ This module provides methods for submitting and managing deliverables.
 
 from typing import TYPE_CHECKING, Any, List, Optional, Union
 
-from .types import ActionItem, ContentType, Deliverable, DeliverableStatus, Feedback, FileAttachment
+import httpx
+
+from ._batch import DEFAULT_MAX_CONCURRENCY, gather_bounded
+from .exceptions import ValidationError
+from .types import (
+    ActionItem,
+    ContentType,
+    Deliverable,
+    DeliverableStatus,
+    Feedback,
+    FileAttachment,
+    _unwrap_list,
+)
 
 if TYPE_CHECKING:
     from .client import CavendoClient
 
 
+# Resource paths, shared by the sync and async variants of each method.
+_DELIVERABLE_PATH = "/api/deliverables/%s"
+_FEEDBACK_PATH = "/api/deliverables/%s/feedback"
+_REVISION_PATH = "/api/deliverables/%s/revision"
+
+# Member -> wire value for query params (httpx would send str(member) otherwise).
+_DELIVERABLE_STATUS_VALUES: dict[str, str] = {m: m.value for m in DeliverableStatus}
+
+# Raw-body markers for a deliverable that has not been reviewed yet. String
+# contents are escaped in JSON, so these can only match the "feedback" field.
+_NO_FEEDBACK_MARKERS = (b'"feedback":null', b'"feedback":""')
+
+# File size limits enforced by the server (UTF-8 bytes of each file's content).
+_MAX_FILE_SIZE = 10 * 1024 * 1024
+_MAX_TOTAL_FILES_SIZE = 50 * 1024 * 1024
+
+
+# Request builders and response parsers shared by the sync and async variants.
+
+
+def _check_file_sizes(files: Optional[List[FileAttachment]]) -> None:
+    """
+    Reject oversized attachments before they are encoded and uploaded.
+
+    Mirrors the server's limits so that a request that would be rejected
+    anyway fails fast instead of sending megabytes of base64 over the wire.
+
+    Raises:
+        ValidationError: If a file or the total exceeds the server limits.
+    """
+    if not files:
+        return
+    total = 0
+    for file in files:
+        content = file.get("content", "")
+        # ASCII (including base64) content is one byte per character
+        size = len(content) if content.isascii() else len(content.encode("utf-8"))
+        if size > _MAX_FILE_SIZE:
+            raise ValidationError(f"File {file.get('filename')} exceeds maximum size of 10MB")
+        total += size
+    if total > _MAX_TOTAL_FILES_SIZE:
+        raise ValidationError("Total file size exceeds maximum of 50MB")
+
+
+def _build_submit_body(
+    title: str,
+    task_id: Optional[int],
+    project_id: Optional[Union[int, str]],
+    content: Optional[str],
+    content_type: Union[str, ContentType],
+    metadata: Optional[dict[str, Any]],
+    summary: Optional[str],
+    files: Optional[List[FileAttachment]],
+    actions: Optional[List[ActionItem]],
+    input_tokens: Optional[int],
+    output_tokens: Optional[int],
+    provider: Optional[str],
+    model: Optional[str],
+) -> dict[str, Any]:
+    """Build the JSON body for submit(), omitting unset fields."""
+    _check_file_sizes(files)
+    fields = (
+        ("title", title),
+        ("contentType", content_type),
+        ("taskId", task_id),
+        ("projectId", project_id),
+        ("content", content),
+        ("metadata", metadata),
+        ("summary", summary),
+        ("files", files),
+        ("actions", actions),
+        ("input_tokens", input_tokens),
+        ("output_tokens", output_tokens),
+        ("provider", provider),
+        ("model", model),
+    )
+    return {k: v for k, v in fields if v is not None}
+
+
+def _build_revision_body(
+    content: Optional[str],
+    title: Optional[str],
+    content_type: Optional[Union[str, ContentType]],
+    metadata: Optional[dict[str, Any]],
+    summary: Optional[str],
+    files: Optional[List[FileAttachment]],
+) -> dict[str, Any]:
+    """Build the JSON body for submit_revision(), omitting unset fields."""
+    _check_file_sizes(files)
+    fields = (
+        ("content", content),
+        ("title", title),
+        ("contentType", content_type),
+        ("metadata", metadata),
+        ("summary", summary),
+        ("files", files),
+    )
+    return {k: v for k, v in fields if v is not None}
+
+
+def _build_mine_params(
+    status: Optional[Union[str, DeliverableStatus]],
+    task_id: Optional[int],
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    """Build the query params for mine()."""
+    filters = (
+        ("status", _DELIVERABLE_STATUS_VALUES.get(status, status) if status else None),
+        ("taskId", task_id),
+    )
+    params: dict[str, Any] = {"limit": limit, "offset": offset}
+    params.update((k, v) for k, v in filters if v)
+    return params
+
+
+def _parse_deliverables(data: Any) -> list[Deliverable]:
+    """Parse a list response (bare array or {deliverables: [...]})."""
+    return Deliverable.from_dicts(_unwrap_list(data, "deliverables"))
+
+
 class DeliverablesAPI:
     """
     API for managing deliverables submitted by the agent.
@@ -72,6 +205,7 @@ class DeliverablesAPI:
                 - filename: Filename with extension (e.g., "landing-page.html")
                 - content: The complete file content. For binary files, prefix with "base64:".
                 - mimeType: Optional MIME type. Auto-detected from extension if not provided.
+                Files are limited to 10MB each and 50MB in total.
             actions: Follow-up action items for the reviewer to complete.
                 Each action dict should have:
                 - action_text: The action item (e.g., "Review the landing page copy")
@@ -82,7 +216,8 @@ class DeliverablesAPI:
             The created Deliverable.
 
         Raises:
-            ValidationError: If required fields are missing or invalid.
+            ValidationError: If required fields are missing or invalid, or files
+                exceed the size limits.
             NotFoundError: If the task doesn't exist.
 
         Example:
@@ -111,34 +246,21 @@ class DeliverablesAPI:
             ...     ]
             ... )
         """
-        body: dict[str, Any] = {
-            "title": title,
-            "contentType": (
-                content_type.value if isinstance(content_type, ContentType) else content_type
-            ),
-        }
-        if task_id is not None:
-            body["taskId"] = task_id
-        if project_id is not None:
-            body["projectId"] = project_id
-        if content is not None:
-            body["content"] = content
-        if metadata is not None:
-            body["metadata"] = metadata
-        if summary is not None:
-            body["summary"] = summary
-        if files is not None:
-            body["files"] = files
-        if actions is not None:
-            body["actions"] = actions
-        if input_tokens is not None:
-            body["input_tokens"] = input_tokens
-        if output_tokens is not None:
-            body["output_tokens"] = output_tokens
-        if provider is not None:
-            body["provider"] = provider
-        if model is not None:
-            body["model"] = model
+        body = _build_submit_body(
+            title=title,
+            task_id=task_id,
+            project_id=project_id,
+            content=content,
+            content_type=content_type,
+            metadata=metadata,
+            summary=summary,
+            files=files,
+            actions=actions,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            provider=provider,
+            model=model,
+        )
 
         data = self._client._request_json("POST", "/api/deliverables", json=body)
         return Deliverable.from_dict(data)
@@ -164,38 +286,50 @@ class DeliverablesAPI:
 
         See submit() for documentation.
         """
-        body: dict[str, Any] = {
-            "title": title,
-            "contentType": (
-                content_type.value if isinstance(content_type, ContentType) else content_type
-            ),
-        }
-        if task_id is not None:
-            body["taskId"] = task_id
-        if project_id is not None:
-            body["projectId"] = project_id
-        if content is not None:
-            body["content"] = content
-        if metadata is not None:
-            body["metadata"] = metadata
-        if summary is not None:
-            body["summary"] = summary
-        if files is not None:
-            body["files"] = files
-        if actions is not None:
-            body["actions"] = actions
-        if input_tokens is not None:
-            body["input_tokens"] = input_tokens
-        if output_tokens is not None:
-            body["output_tokens"] = output_tokens
-        if provider is not None:
-            body["provider"] = provider
-        if model is not None:
-            body["model"] = model
+        body = _build_submit_body(
+            title=title,
+            task_id=task_id,
+            project_id=project_id,
+            content=content,
+            content_type=content_type,
+            metadata=metadata,
+            summary=summary,
+            files=files,
+            actions=actions,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            provider=provider,
+            model=model,
+        )
 
         data = await self._client._request_json_async("POST", "/api/deliverables", json=body)
         return Deliverable.from_dict(data)
 
+    async def submit_many_async(
+        self,
+        submissions: List[dict[str, Any]],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[Deliverable]:
+        """
+        Submit several deliverables concurrently.
+
+        Args:
+            submissions: One dict of submit() keyword arguments per deliverable.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            The created Deliverables, in the same order as ``submissions``.
+
+        Example:
+            >>> deliverables = await client.deliverables.submit_many_async([
+            ...     {"task_id": 1, "title": "Report A", "content": "..."},
+            ...     {"task_id": 2, "title": "Report B", "content": "..."},
+            ... ])
+        """
+        return await gather_bounded(
+            lambda kwargs: self.submit_async(**kwargs), submissions, max_concurrency
+        )
+
     def get(self, deliverable_id: int) -> Deliverable:
         """
         Get a specific deliverable by ID.
@@ -213,7 +347,7 @@ class DeliverablesAPI:
             >>> deliverable = client.deliverables.get(456)
             >>> print(deliverable.content)
         """
-        data = self._client._request_json("GET", f"/api/deliverables/{deliverable_id}")
+        data = self._client._request_json("GET", _DELIVERABLE_PATH % deliverable_id)
         return Deliverable.from_dict(data)
 
     async def get_async(self, deliverable_id: int) -> Deliverable:
@@ -222,9 +356,27 @@ class DeliverablesAPI:
 
         See get() for documentation.
         """
-        data = await self._client._request_json_async("GET", f"/api/deliverables/{deliverable_id}")
+        data = await self._client._request_json_async("GET", _DELIVERABLE_PATH % deliverable_id)
         return Deliverable.from_dict(data)
 
+    def _parse_feedback(self, response: httpx.Response) -> Optional[Feedback]:
+        """
+        Parse a feedback response, or return None if there is no feedback yet.
+
+        Agents poll this endpoint until a review lands, so the common empty case
+        is detected on the raw body without decoding the JSON.
+        """
+        content = response.content
+        if not content or any(marker in content for marker in _NO_FEEDBACK_MARKERS):
+            return None
+
+        data = self._client._extract_data(response)
+        if not data or (isinstance(data, dict) and not data.get("feedback")):
+            return None
+
+        # API returns {id, status, feedback, reviewedBy, reviewedAt}
+        return Feedback.from_dict(data)
+
     def get_feedback(self, deliverable_id: int) -> Optional[Feedback]:
         """
         Get feedback for a deliverable.
@@ -241,13 +393,8 @@ class DeliverablesAPI:
             ...     if feedback.status == "revision_requested":
             ...         print(f"Revision needed: {feedback.content}")
         """
-        data = self._client._request_json("GET", f"/api/deliverables/{deliverable_id}/feedback")
-
-        if not data or (isinstance(data, dict) and not data.get("feedback")):
-            return None
-
-        # API returns {id, status, feedback, reviewedBy, reviewedAt}
-        return Feedback.from_dict(data)
+        response = self._client._request("GET", _FEEDBACK_PATH % deliverable_id)
+        return self._parse_feedback(response)
 
     async def get_feedback_async(self, deliverable_id: int) -> Optional[Feedback]:
         """
@@ -255,14 +402,25 @@ class DeliverablesAPI:
 
         See get_feedback() for documentation.
         """
-        data = await self._client._request_json_async(
-            "GET", f"/api/deliverables/{deliverable_id}/feedback"
-        )
+        response = await self._client._request_async("GET", _FEEDBACK_PATH % deliverable_id)
+        return self._parse_feedback(response)
 
-        if not data or (isinstance(data, dict) and not data.get("feedback")):
-            return None
+    async def get_feedback_many_async(
+        self,
+        deliverable_ids: List[int],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[Optional[Feedback]]:
+        """
+        Get feedback for several deliverables concurrently.
 
-        return Feedback.from_dict(data)
+        Args:
+            deliverable_ids: The deliverable IDs to get feedback for.
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Feedback (or None) for each deliverable, in the same order as the IDs.
+        """
+        return await gather_bounded(self.get_feedback_async, deliverable_ids, max_concurrency)
 
     def submit_revision(
         self,
@@ -296,6 +454,7 @@ class DeliverablesAPI:
                 - filename: Filename with extension (e.g., "landing-page.html")
                 - content: The complete file content. For binary files, prefix with "base64:".
                 - mimeType: Optional MIME type. Auto-detected from extension if not provided.
+                Files are limited to 10MB each and 50MB in total.
 
         Returns:
             The updated Deliverable with incremented version.
@@ -323,25 +482,16 @@ class DeliverablesAPI:
             ...     ]
             ... )
         """
-        body: dict[str, Any] = {}
-        if content is not None:
-            body["content"] = content
-        if title is not None:
-            body["title"] = title
-        if content_type is not None:
-            body["contentType"] = (
-                content_type.value if isinstance(content_type, ContentType) else content_type
-            )
-        if metadata is not None:
-            body["metadata"] = metadata
-        if summary is not None:
-            body["summary"] = summary
-        if files is not None:
-            body["files"] = files
-
-        data = self._client._request_json(
-            "POST", f"/api/deliverables/{deliverable_id}/revision", json=body
+        body = _build_revision_body(
+            content=content,
+            title=title,
+            content_type=content_type,
+            metadata=metadata,
+            summary=summary,
+            files=files,
         )
+
+        data = self._client._request_json("POST", _REVISION_PATH % deliverable_id, json=body)
         return Deliverable.from_dict(data)
 
     async def submit_revision_async(
@@ -359,24 +509,17 @@ class DeliverablesAPI:
 
         See submit_revision() for documentation.
         """
-        body: dict[str, Any] = {}
-        if content is not None:
-            body["content"] = content
-        if title is not None:
-            body["title"] = title
-        if content_type is not None:
-            body["contentType"] = (
-                content_type.value if isinstance(content_type, ContentType) else content_type
-            )
-        if metadata is not None:
-            body["metadata"] = metadata
-        if summary is not None:
-            body["summary"] = summary
-        if files is not None:
-            body["files"] = files
+        body = _build_revision_body(
+            content=content,
+            title=title,
+            content_type=content_type,
+            metadata=metadata,
+            summary=summary,
+            files=files,
+        )
 
         data = await self._client._request_json_async(
-            "POST", f"/api/deliverables/{deliverable_id}/revision", json=body
+            "POST", _REVISION_PATH % deliverable_id, json=body
         )
         return Deliverable.from_dict(data)
 
@@ -406,18 +549,11 @@ class DeliverablesAPI:
             >>> # Get deliverables needing revision
             >>> to_revise = client.deliverables.mine(status="revision_requested")
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if status:
-            params["status"] = (
-                status.value if isinstance(status, DeliverableStatus) else status
-            )
-        if task_id:
-            params["taskId"] = task_id
+        params = _build_mine_params(status=status, task_id=task_id, limit=limit, offset=offset)
 
         data = self._client._request_json("GET", "/api/deliverables/mine", params=params)
 
-        deliverables_data = data if isinstance(data, list) else data.get("deliverables", [])
-        return [Deliverable.from_dict(d) for d in deliverables_data]
+        return _parse_deliverables(data)
 
     async def mine_async(
         self,
@@ -431,17 +567,10 @@ class DeliverablesAPI:
 
         See mine() for documentation.
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if status:
-            params["status"] = (
-                status.value if isinstance(status, DeliverableStatus) else status
-            )
-        if task_id:
-            params["taskId"] = task_id
+        params = _build_mine_params(status=status, task_id=task_id, limit=limit, offset=offset)
 
         data = await self._client._request_json_async(
             "GET", "/api/deliverables/mine", params=params
         )
 
-        deliverables_data = data if isinstance(data, list) else data.get("deliverables", [])
-        return [Deliverable.from_dict(d) for d in deliverables_data]
+        return _parse_deliverables(data)
@@ -21,6 +21,9 @@ class CavendoError(Exception):
         response_body: Raw response body from the API if available.
     """
 
+    # Slots keep per-instance state out of the lazily created __dict__.
+    __slots__ = ("message", "status_code", "response_body")
+
     def __init__(
         self,
         message: str,
@@ -37,6 +40,16 @@ class CavendoError(Exception):
             return f"[{self.status_code}] {self.message}"
         return self.message
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The default reduce only carries args and __dict__; include slot values
+        # so errors survive pickling (e.g. across process pools).
+        state = dict(getattr(self, "__dict__", {}))
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (type(self), self.args, state)
+
 
 class AuthenticationError(CavendoError):
     """
@@ -48,6 +61,8 @@ class AuthenticationError(CavendoError):
     - The agent associated with the key has been deactivated
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Authentication failed. Check your API key.",
@@ -65,6 +80,8 @@ class AuthorizationError(CavendoError):
     scopes or permissions not granted to the agent.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Insufficient permissions for this action.",
@@ -83,6 +100,8 @@ class NotFoundError(CavendoError):
     - The resource exists but the agent doesn't have access to it
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Resource not found.",
@@ -105,6 +124,8 @@ class ValidationError(CavendoError):
         errors: Dictionary mapping field names to error messages.
     """
 
+    __slots__ = ("errors",)
+
     def __init__(
         self,
         message: str = "Validation error.",
@@ -124,6 +145,8 @@ class RateLimitError(CavendoError):
         retry_after: Number of seconds to wait before retrying.
     """
 
+    __slots__ = ("retry_after",)
+
     def __init__(
         self,
         message: str = "Rate limit exceeded.",
@@ -142,6 +165,8 @@ class ServerError(CavendoError):
     This indicates an issue on the Cavendo server side.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Server error occurred.",
@@ -161,6 +186,8 @@ class CavendoConnectionError(CavendoError):
     - DNS resolution fails
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Failed to connect to Cavendo API.",
@@ -174,6 +201,8 @@ class CavendoTimeoutError(CavendoError):
     Raised when a request times out.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str = "Request timed out.",
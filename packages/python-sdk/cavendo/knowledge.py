@@ -4,14 +4,71 @@ Knowledge API for the Cavendo SDK.
 This module provides methods for searching and retrieving knowledge documents.
 """
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional
 
-from .types import KnowledgeDocument, SearchResult
+from ._batch import DEFAULT_MAX_CONCURRENCY, gather_bounded
+from .types import KnowledgeDocument, SearchResult, _unwrap_list
 
 if TYPE_CHECKING:
     from .client import CavendoClient
 
 
+# Resource paths, shared by the sync and async variants of each method.
+_KNOWLEDGE_PATH = "/api/knowledge/%s"
+
+
+# Request builders and response parsers shared by the sync and async variants.
+
+
+@lru_cache(maxsize=256)
+def _join_tags(tags: tuple[str, ...]) -> str:
+    """Join a tag filter for the query string; agents tend to reuse the same tags."""
+    return ",".join(tags)
+
+
+def _build_search_params(
+    query: str,
+    project_id: Optional[int],
+    tags: Optional[list[str]],
+    limit: int,
+) -> dict[str, Any]:
+    """Build the query params for search(), omitting unset filters."""
+    fields = (
+        ("q", query),
+        ("limit", limit),
+        ("projectId", project_id),
+        ("tags", _join_tags(tuple(tags)) if tags else None),
+    )
+    return {k: v for k, v in fields if v is not None}
+
+
+def _build_list_params(
+    project_id: Optional[int],
+    tags: Optional[list[str]],
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    """Build the query params for list_all(), omitting unset filters."""
+    fields = (
+        ("limit", limit),
+        ("offset", offset),
+        ("projectId", project_id),
+        ("tags", _join_tags(tuple(tags)) if tags else None),
+    )
+    return {k: v for k, v in fields if v is not None}
+
+
+def _parse_search_results(data: Any) -> list[SearchResult]:
+    """Parse a search response (bare array or {results: [...]})."""
+    return SearchResult.from_dicts(_unwrap_list(data, "results"))
+
+
+def _parse_documents(data: Any) -> list[KnowledgeDocument]:
+    """Parse a list response (bare array or {documents: [...]})."""
+    return KnowledgeDocument.from_dicts(_unwrap_list(data, "documents"))
+
+
 class KnowledgeAPI:
     """
     API for accessing the knowledge base.
@@ -59,16 +116,11 @@ class KnowledgeAPI:
             ...     for highlight in result.highlights:
             ...         print(f"  - {highlight}")
         """
-        params: dict[str, Any] = {"q": query, "limit": limit}
-        if project_id is not None:
-            params["projectId"] = project_id
-        if tags:
-            params["tags"] = ",".join(tags)
+        params = _build_search_params(query=query, project_id=project_id, tags=tags, limit=limit)
 
         data = self._client._request_json("GET", "/api/knowledge/search", params=params)
 
-        results_data = data if isinstance(data, list) else data.get("results", [])
-        return [SearchResult.from_dict(r) for r in results_data]
+        return _parse_search_results(data)
 
     async def search_async(
         self,
@@ -82,16 +134,43 @@ class KnowledgeAPI:
 
         See search() for documentation.
         """
-        params: dict[str, Any] = {"q": query, "limit": limit}
-        if project_id is not None:
-            params["projectId"] = project_id
-        if tags:
-            params["tags"] = ",".join(tags)
+        params = _build_search_params(query=query, project_id=project_id, tags=tags, limit=limit)
 
         data = await self._client._request_json_async("GET", "/api/knowledge/search", params=params)
 
-        results_data = data if isinstance(data, list) else data.get("results", [])
-        return [SearchResult.from_dict(r) for r in results_data]
+        return _parse_search_results(data)
+
+    async def search_many_async(
+        self,
+        queries: list[str],
+        project_id: Optional[int] = None,
+        tags: Optional[list[str]] = None,
+        limit: int = 10,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> list[list[SearchResult]]:
+        """
+        Run several knowledge searches concurrently.
+
+        Args:
+            queries: Search query strings.
+            project_id: Optional project ID to scope every search.
+            tags: Optional list of tags to filter every search by.
+            limit: Maximum number of results per query (default 10).
+            max_concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            One list of SearchResult objects per query, in the same order.
+
+        Example:
+            >>> pricing, competitors = await client.knowledge.search_many_async(
+            ...     ["pricing strategy", "competitor analysis"], project_id=3
+            ... )
+        """
+        return await gather_bounded(
+            lambda query: self.search_async(query, project_id=project_id, tags=tags, limit=limit),
+            queries,
+            max_concurrency,
+        )
 
     def get(self, knowledge_id: int) -> KnowledgeDocument:
         """
@@ -110,7 +189,7 @@ class KnowledgeAPI:
             >>> doc = client.knowledge.get(5)
             >>> print(doc.content)
         """
-        data = self._client._request_json("GET", f"/api/knowledge/{knowledge_id}")
+        data = self._client._request_json("GET", _KNOWLEDGE_PATH % knowledge_id)
         return KnowledgeDocument.from_dict(data)
 
     async def get_async(self, knowledge_id: int) -> KnowledgeDocument:
@@ -119,7 +198,7 @@ class KnowledgeAPI:
 
         See get() for documentation.
         """
-        data = await self._client._request_json_async("GET", f"/api/knowledge/{knowledge_id}")
+        data = await self._client._request_json_async("GET", _KNOWLEDGE_PATH % knowledge_id)
         return KnowledgeDocument.from_dict(data)
 
     def list_all(
@@ -146,16 +225,11 @@ class KnowledgeAPI:
             >>> for doc in docs:
             ...     print(f"{doc.id}: {doc.title}")
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if project_id is not None:
-            params["projectId"] = project_id
-        if tags:
-            params["tags"] = ",".join(tags)
+        params = _build_list_params(project_id=project_id, tags=tags, limit=limit, offset=offset)
 
         data = self._client._request_json("GET", "/api/knowledge", params=params)
 
-        docs_data = data if isinstance(data, list) else data.get("documents", [])
-        return [KnowledgeDocument.from_dict(d) for d in docs_data]
+        return _parse_documents(data)
 
     async def list_all_async(
         self,
@@ -169,13 +243,8 @@ class KnowledgeAPI:
 
         See list_all() for documentation.
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if project_id is not None:
-            params["projectId"] = project_id
-        if tags:
-            params["tags"] = ",".join(tags)
+        params = _build_list_params(project_id=project_id, tags=tags, limit=limit, offset=offset)
 
         data = await self._client._request_json_async("GET", "/api/knowledge", params=params)
 
-        docs_data = data if isinstance(data, list) else data.get("documents", [])
-        return [KnowledgeDocument.from_dict(d) for d in docs_data]
+        return _parse_documents(data)
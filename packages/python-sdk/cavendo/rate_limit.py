@@ -0,0 +1,177 @@
+"""
+Client-side rate limiting for the Cavendo SDK.
+
+This module provides an adaptive limiter that a CavendoClient consults before
+each request. It combines two signals:
+
+- Server rate-limit headers (``RateLimit-Remaining``/``RateLimit-Reset`` and
+  ``Retry-After``), which pause new requests until the window resets.
+- AIMD (additive increase, multiplicative decrease) concurrency control: the
+  number of requests allowed in flight grows slowly while responses succeed and
+  is cut sharply on 429 or 5xx responses.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+import httpx
+
+# Accept both the IETF draft header names (sent by the Cavendo server) and the
+# legacy X- prefixed variants.
+_REMAINING_HEADERS = ("RateLimit-Remaining", "X-RateLimit-Remaining")
+_RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset")
+
+# Polling interval (seconds) used by async waiters while the limiter is full.
+_ASYNC_POLL_INTERVAL = 0.05
+
+
+def _header_number(response: httpx.Response, names: tuple[str, ...]) -> Optional[float]:
+    """Return the first of ``names`` present in the response headers, as a number."""
+    for name in names:
+        value = response.headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Adaptive concurrency limiter shared by a client's sync and async requests.
+
+    The in-flight limit starts at ``initial_concurrency``. Each successful
+    response raises it by ``increase / limit`` (roughly ``increase`` per full
+    window of requests); each 429 or 5xx response multiplies it by
+    ``decrease``. The limit always stays between ``min_concurrency`` and
+    ``max_concurrency``.
+
+    When the server reports that no requests remain in the current window, or
+    sends ``Retry-After``, new requests wait until the window resets.
+
+    Example:
+        >>> from cavendo import AdaptiveRateLimiter, CavendoClient
+        >>> client = CavendoClient(rate_limiter=AdaptiveRateLimiter(max_concurrency=16))
+    """
+
+    def __init__(
+        self,
+        initial_concurrency: float = 8,
+        min_concurrency: float = 1,
+        max_concurrency: float = 64,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_concurrency: Starting number of requests allowed in flight.
+            min_concurrency: Lower bound for the in-flight limit (at least 1).
+            max_concurrency: Upper bound for the in-flight limit.
+            increase: Additive increase applied per window of successful responses.
+            decrease: Multiplicative factor applied on 429/5xx responses (0-1).
+
+        Raises:
+            ValueError: If the bounds or factors are out of range.
+        """
+        if min_concurrency < 1 or max_concurrency < min_concurrency:
+            raise ValueError("Require 1 <= min_concurrency <= max_concurrency")
+        if not 0 < decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        if increase <= 0:
+            raise ValueError("increase must be positive")
+
+        self._min = float(min_concurrency)
+        self._max = float(max_concurrency)
+        self._increase = float(increase)
+        self._decrease = float(decrease)
+        self._limit = min(max(float(initial_concurrency), self._min), self._max)
+        self._in_flight = 0
+        self._blocked_until = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> float:
+        """Current in-flight request limit."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    def _wait_time(self) -> Optional[float]:
+        """
+        Try to take a slot. Must be called with the condition held.
+
+        Returns:
+            None if a slot was taken, otherwise how long to wait before retrying
+            (0 means wait for another request to finish).
+        """
+        now = time.monotonic()
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return None
+        return 0.0
+
+    def acquire(self) -> None:
+        """Block until a request slot is available."""
+        with self._cond:
+            while True:
+                wait = self._wait_time()
+                if wait is None:
+                    return
+                self._cond.wait(timeout=wait or None)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a request slot is available."""
+        while True:
+            with self._cond:
+                wait = self._wait_time()
+            if wait is None:
+                return
+            await asyncio.sleep(wait or _ASYNC_POLL_INTERVAL)
+
+    def release(self, response: Optional[httpx.Response] = None) -> None:
+        """
+        Release a slot taken by acquire(), adapting to the response if given.
+
+        Args:
+            response: The response received, or None if the request failed
+                before a response arrived (no adaptation is applied).
+        """
+        with self._cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            if response is not None:
+                self._record(response)
+            self._cond.notify_all()
+
+    def _record(self, response: httpx.Response) -> None:
+        """Update the limit and pause window from a response."""
+        status_code = response.status_code
+        now = time.monotonic()
+
+        if status_code == 429 or status_code >= 500:
+            self._limit = max(self._min, self._limit * self._decrease)
+        elif response.is_success:
+            self._limit = min(self._max, self._limit + self._increase / self._limit)
+
+        retry_after = _header_number(response, ("Retry-After",))
+        if retry_after is not None and status_code == 429:
+            self._blocked_until = max(self._blocked_until, now + retry_after)
+            return
+
+        remaining = _header_number(response, _REMAINING_HEADERS)
+        reset = _header_number(response, _RESET_HEADERS)
+        if remaining is not None and remaining <= 0 and reset is not None:
+            # Reset is seconds until the window resets; very large values are
+            # treated as an absolute Unix timestamp.
+            delay = reset - time.time() if reset > 1e9 else reset
+            if delay > 0:
+                self._blocked_until = max(self._blocked_until, now + delay)
@@ -4,13 +4,120 @@ Tasks API for the Cavendo SDK.
 This module provides methods for interacting with tasks assigned to the agent.
 """
 
-from typing import TYPE_CHECKING, Any, Optional, Union
-
-from .types import Task, TaskContext, TaskStatus
+import asyncio
+import copy
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+import httpx
+
+from ._batch import gather_bounded
+from ._cache import SingleFlight, TTLCache
+from ._progress import ProgressBuffer
+from .exceptions import CavendoError
+from .types import Task, TaskContext, TaskStatus, _unwrap_list
 
 if TYPE_CHECKING:
+    from _typeshed import DataclassInstance
+
     from .client import CavendoClient
 
+_T = TypeVar("_T")
+
+# progress/details payloads: a dict, or a dataclass instance that the client's
+# JSON encoder serializes directly without building an intermediate dict.
+_Payload = Union[dict[str, Any], "DataclassInstance"]
+
+# Member -> wire value; plain strings hash equal to their member, so lookups
+# with .get(status, status) normalize both without an isinstance check.
+_TASK_STATUS_VALUES: dict[str, str] = {m: m.value for m in TaskStatus}
+
+# Resource paths, shared by the sync and async variants of each method.
+_TASK_PATH = "/api/tasks/%s"
+_CONTEXT_PATH = "/api/tasks/%s/context"
+_STATUS_PATH = "/api/tasks/%s/status"
+_CLAIM_PATH = "/api/tasks/%s/claim"
+_PROGRESS_PATH = "/api/tasks/%s/progress"
+
+
+# Query params for an unfiltered list_all() with default paging. Read-only so
+# the shared instance can be handed to every call without copying.
+_DEFAULT_LIST_PARAMS: Mapping[str, Any] = MappingProxyType({"limit": 50, "offset": 0})
+
+# Largest limit the task list endpoint honors; larger values are clamped by the
+# server, which would make a full page look short and end paging early.
+_MAX_PAGE_SIZE = 500
+
+# Most tasks (and, separately, task contexts) whose ETag is remembered when the
+# client revalidates; the least recently used are dropped first.
+_ETAG_CACHE_SIZE = 256
+
+
+# Request builders and response parsers shared by the sync and async variants.
+
+
+def _build_list_params(
+    status: Optional[Union[str, TaskStatus]],
+    project_id: Optional[int],
+    limit: int,
+    offset: int,
+) -> Mapping[str, Any]:
+    """Build the query params for list_all(), omitting unset filters."""
+    if not status and not project_id and limit == 50 and offset == 0:
+        return _DEFAULT_LIST_PARAMS
+    params: dict[str, Any] = {"limit": limit, "offset": offset}
+    if status:
+        params["status"] = _TASK_STATUS_VALUES.get(status, status)
+    if project_id:
+        params["projectId"] = project_id
+    return params
+
+
+def _build_status_body(
+    status: Union[str, TaskStatus],
+    progress: Optional[_Payload],
+) -> dict[str, Any]:
+    """Build the JSON body for update_status()."""
+    body: dict[str, Any] = {"status": _TASK_STATUS_VALUES.get(status, status)}
+    if progress is not None:
+        body["progress"] = progress
+    return body
+
+
+def _build_progress_body(
+    message: str,
+    percent_complete: Optional[int],
+    details: Optional[_Payload],
+) -> dict[str, Any]:
+    """Build the JSON body for log_progress(), omitting unset fields."""
+    body: dict[str, Any] = {"message": message}
+    if percent_complete is not None:
+        body["percentComplete"] = percent_complete
+    if details is not None:
+        body["details"] = details
+    return body
+
+
+def _if_none_match(entry: Optional[tuple[str, Any]]) -> Optional[dict[str, str]]:
+    """Build conditional request headers from an (etag, value) cache entry."""
+    return {"If-None-Match": entry[0]} if entry else None
+
+
+def _parse_next_task(data: Any) -> Optional[Task]:
+    """Parse a next-task response: {task: ...} or {task: null, reason: ...}."""
+    task_data = data.get("task") if isinstance(data, dict) else data
+    return Task.from_dict(task_data) if task_data else None
+
 
 class TasksAPI:
     """
@@ -28,6 +135,90 @@ class TasksAPI:
             client: The CavendoClient instance to use for API calls.
         """
         self._client = client
+        # get()/context() results, memoized for the client's cache_ttl (off by default)
+        self._task_cache: TTLCache[int, Task] = TTLCache(client._cache_ttl)
+        self._context_cache: TTLCache[int, TaskContext] = TTLCache(client._cache_ttl)
+        # (etag, value) of recent get()/context() responses, revalidated with
+        # If-None-Match so an unchanged task is not decoded again (off by default)
+        etag_ttl = float("inf") if client._revalidate else 0.0
+        self._task_etags: TTLCache[int, tuple[str, Task]] = TTLCache(etag_ttl, _ETAG_CACHE_SIZE)
+        self._context_etags: TTLCache[int, tuple[str, TaskContext]] = TTLCache(
+            etag_ttl, _ETAG_CACHE_SIZE
+        )
+        # Concurrent identical async reads share one request
+        self._get_flights: SingleFlight[int, Task] = SingleFlight()
+        self._context_flights: SingleFlight[int, TaskContext] = SingleFlight()
+        self._list_flights: SingleFlight[tuple[Any, ...], list[Task]] = SingleFlight()
+        self._progress_buffer: Optional[ProgressBuffer] = None
+
+    def invalidate(self, task_id: Optional[int] = None) -> None:
+        """
+        Drop cached get()/context() results.
+
+        Writes made through this client keep the cache current (update_status
+        and claim store the returned task, log_progress invalidates it); call
+        this after changes made elsewhere.
+
+        Args:
+            task_id: The task to invalidate, or None to clear all cached tasks.
+        """
+        if task_id is None:
+            self._task_cache.clear()
+            self._context_cache.clear()
+            self._task_etags.clear()
+            self._context_etags.clear()
+        else:
+            self._task_cache.pop(task_id)
+            self._context_cache.pop(task_id)
+            self._task_etags.pop(task_id)
+            self._context_etags.pop(task_id)
+        self._forget_flights(task_id)
+
+    def _forget_flights(self, task_id: Optional[int]) -> None:
+        """Stop later reads from joining requests that started before a write."""
+        self._get_flights.forget(task_id)
+        self._context_flights.forget(task_id)
+        self._list_flights.forget()
+
+    def _revalidated(
+        self,
+        response: httpx.Response,
+        entry: Optional[tuple[str, _T]],
+        etags: TTLCache[int, tuple[str, _T]],
+        task_id: int,
+        parse: Callable[[Any], _T],
+    ) -> _T:
+        """Return a copy of the cached value on 304, else parse the response and store its ETag."""
+        # Callers get their own shallow copy, so one caller's edits never reach the
+        # stored instance; copy.copy keeps TaskContext's lazy lists unparsed.
+        if response.status_code == 304 and entry is not None:
+            return copy.copy(entry[1])
+        value = parse(self._client._extract_data(response))
+        etag = response.headers.get("ETag")
+        if etag:
+            etags.set(task_id, (etag, copy.copy(value)))
+        return value
+
+    def _remember(self, task: Task) -> Task:
+        """Cache a task returned by a write and drop its now-stale context."""
+        self._context_cache.pop(task.id)
+        self._task_cache.set(task.id, task)
+        self._forget_flights(task.id)
+        return task
+
+    def _cached_if_unchanged(
+        self,
+        task_id: int,
+        status: Union[str, TaskStatus],
+        progress: Optional[_Payload],
+    ) -> Optional[Task]:
+        """Return the cached task if update_status() would leave it unchanged."""
+        if progress is not None:
+            return None
+        task = self._task_cache.get(task_id)
+        if task is not None and task.status.value == _TASK_STATUS_VALUES.get(status, status):
+            return task
+        return None
 
     def list_all(
         self,
@@ -53,17 +244,11 @@ class TasksAPI:
             >>> for task in tasks:
             ...     print(f"{task.id}: {task.title}")
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if status:
-            params["status"] = status.value if isinstance(status, TaskStatus) else status
-        if project_id:
-            params["projectId"] = project_id
-
+        params = _build_list_params(status, project_id, limit, offset)
         data = self._client._request_json("GET", "/api/agents/me/tasks", params=params)
 
         # Handle both array and paginated response formats
-        tasks_data = data if isinstance(data, list) else data.get("tasks", [])
-        return [Task.from_dict(t) for t in tasks_data]
+        return Task.from_dicts(_unwrap_list(data, "tasks"))
 
     async def list_all_async(
         self,
@@ -77,16 +262,119 @@ class TasksAPI:
 
         See list_all() for documentation.
         """
-        params: dict[str, Any] = {"limit": limit, "offset": offset}
-        if status:
-            params["status"] = status.value if isinstance(status, TaskStatus) else status
-        if project_id:
-            params["projectId"] = project_id
+        params = _build_list_params(status, project_id, limit, offset)
+
+        async def fetch() -> list[Task]:
+            return await self._fetch_list_async(params)
+
+        # Copy so that callers sharing one request don't share one list
+        return list(await self._list_flights.run((status, project_id, limit, offset), fetch))
 
+    async def _fetch_list_async(self, params: Mapping[str, Any]) -> list[Task]:
         data = await self._client._request_json_async("GET", "/api/agents/me/tasks", params=params)
+        return Task.from_dicts(_unwrap_list(data, "tasks"))
+
+    async def list_all_paged_async(
+        self,
+        status: Optional[Union[str, TaskStatus]] = None,
+        project_id: Optional[int] = None,
+        page_size: int = 50,
+        max_concurrency: int = 8,
+    ) -> list[Task]:
+        """
+        List all matching tasks, fetching pages concurrently.
+
+        The first page is fetched on its own. If it is full, the following
+        pages are requested in concurrent waves of ``max_concurrency`` until a
+        short page marks the end of the results.
 
-        tasks_data = data if isinstance(data, list) else data.get("tasks", [])
-        return [Task.from_dict(t) for t in tasks_data]
+        Args:
+            status: Filter by task status.
+            project_id: Filter by project ID.
+            page_size: Tasks per request. Values above the server's cap of 500
+                are clamped to 500.
+            max_concurrency: Maximum number of page requests in flight.
+
+        Returns:
+            All matching Task objects, in server order.
+
+        Example:
+            >>> tasks = await client.tasks.list_all_paged_async(status="pending")
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        page_size = min(page_size, _MAX_PAGE_SIZE)
+
+        async def fetch_page(offset: int) -> list[Task]:
+            return await self.list_all_async(
+                status=status, project_id=project_id, limit=page_size, offset=offset
+            )
+
+        tasks = await fetch_page(0)
+        offset = page_size
+        more = len(tasks) == page_size
+        while more:
+            offsets = range(offset, offset + page_size * max_concurrency, page_size)
+            pages = await gather_bounded(fetch_page, offsets, max_concurrency)
+            for page in pages:
+                tasks.extend(page)
+            more = len(pages[-1]) == page_size
+            offset = offsets.stop
+        return tasks
+
+    async def iter_all_async(
+        self,
+        status: Optional[Union[str, TaskStatus]] = None,
+        project_id: Optional[int] = None,
+        page_size: int = 50,
+    ) -> AsyncIterator[Task]:
+        """
+        Iterate over all matching tasks, one page in memory at a time.
+
+        Tasks from the first page are yielded as soon as it arrives, while the
+        next page is prefetched in the background. Stopping iteration early
+        cancels the pending prefetch request. Pages are fetched directly rather
+        than shared with concurrent list_all_async() calls, so that cancel
+        reaches the HTTP request.
+
+        Args:
+            status: Filter by task status.
+            project_id: Filter by project ID.
+            page_size: Tasks per request. Values above the server's cap of 500
+                are clamped to 500.
+
+        Yields:
+            Task objects, in server order.
+
+        Example:
+            >>> async for task in client.tasks.iter_all_async(status="pending"):
+            ...     await handle(task)
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        page_size = min(page_size, _MAX_PAGE_SIZE)
+
+        def fetch_page(offset: int) -> Awaitable[list[Task]]:
+            return self._fetch_list_async(_build_list_params(status, project_id, page_size, offset))
+
+        offset = 0
+        page = await fetch_page(offset)
+        while True:
+            prefetch: Optional[asyncio.Future[list[Task]]] = None
+            if len(page) == page_size:
+                offset += page_size
+                prefetch = asyncio.ensure_future(fetch_page(offset))
+            try:
+                for task in page:
+                    yield task
+            except BaseException:
+                # Consumer stopped early (or failed): drop the in-flight page
+                if prefetch is not None:
+                    prefetch.cancel()
+                raise
+            if prefetch is None:
+                return
+            page = await prefetch
 
     def next(self) -> Optional[Task]:
         """
@@ -104,13 +392,8 @@ class TasksAPI:
             ...     client.tasks.update_status(task.id, "in_progress")
         """
         data = self._client._request_json("GET", "/api/agents/me/tasks/next")
-
-        if not data or (isinstance(data, dict) and not data.get("task")):
-            return None
-
-        # API returns {task: ...} or {task: null, reason: ...}
-        task_data = data.get("task") if isinstance(data, dict) else data
-        return Task.from_dict(task_data) if task_data else None
+        task = _parse_next_task(data)
+        return self._remember(task) if task else None
 
     async def next_async(self) -> Optional[Task]:
         """
@@ -119,12 +402,41 @@ class TasksAPI:
         See next() for documentation.
         """
         data = await self._client._request_json_async("GET", "/api/agents/me/tasks/next")
+        task = _parse_next_task(data)
+        return self._remember(task) if task else None
 
-        if not data or (isinstance(data, dict) and not data.get("task")):
-            return None
+    async def poll_next_async(
+        self, min_interval: float = 1.0, max_interval: float = 30.0
+    ) -> AsyncIterator[Task]:
+        """
+        Yield the next task each time one is available, polling next_async().
+
+        After a task is yielded the next poll happens immediately. While no task
+        is available, the wait between polls doubles from ``min_interval`` up to
+        ``max_interval``, so an idle agent makes few empty requests. A yielded
+        task that is not claimed or moved on will be returned again.
+
+        Args:
+            min_interval: Seconds to wait after the first empty poll.
+            max_interval: Maximum seconds to wait between empty polls.
 
-        task_data = data.get("task") if isinstance(data, dict) else data
-        return Task.from_dict(task_data) if task_data else None
+        Yields:
+            The next Task to work on.
+
+        Example:
+            >>> async for task in client.tasks.poll_next_async():
+            ...     await client.tasks.claim_async(task.id)
+            ...     ...
+        """
+        interval = min_interval
+        while True:
+            task = await self.next_async()
+            if task is not None:
+                interval = min_interval
+                yield task
+                continue
+            await asyncio.sleep(interval)
+            interval = min(interval * 2, max_interval)
 
     def get(self, task_id: int) -> Task:
         """
@@ -143,8 +455,15 @@ class TasksAPI:
             >>> task = client.tasks.get(123)
             >>> print(task.description)
         """
-        data = self._client._request_json("GET", f"/api/tasks/{task_id}")
-        return Task.from_dict(data)
+        task = self._task_cache.get(task_id)
+        if task is None:
+            entry = self._task_etags.get(task_id)
+            response = self._client._request(
+                "GET", _TASK_PATH % task_id, headers=_if_none_match(entry)
+            )
+            task = self._revalidated(response, entry, self._task_etags, task_id, Task.from_dict)
+            self._task_cache.set(task_id, task)
+        return task
 
     async def get_async(self, task_id: int) -> Task:
         """
@@ -152,8 +471,19 @@ class TasksAPI:
 
         See get() for documentation.
         """
-        data = await self._client._request_json_async("GET", f"/api/tasks/{task_id}")
-        return Task.from_dict(data)
+        task = self._task_cache.get(task_id)
+        if task is None:
+            task = await self._get_flights.run(task_id, lambda: self._fetch_task_async(task_id))
+        return task
+
+    async def _fetch_task_async(self, task_id: int) -> Task:
+        entry = self._task_etags.get(task_id)
+        response = await self._client._request_async(
+            "GET", _TASK_PATH % task_id, headers=_if_none_match(entry)
+        )
+        task = self._revalidated(response, entry, self._task_etags, task_id, Task.from_dict)
+        self._task_cache.set(task_id, task)
+        return task
 
     def context(self, task_id: int) -> TaskContext:
         """
@@ -174,8 +504,17 @@ class TasksAPI:
             >>> for doc in context.knowledge:
             ...     print(f"Reference: {doc.title}")
         """
-        data = self._client._request_json("GET", f"/api/tasks/{task_id}/context")
-        return TaskContext.from_dict(data)
+        context = self._context_cache.get(task_id)
+        if context is None:
+            entry = self._context_etags.get(task_id)
+            response = self._client._request(
+                "GET", _CONTEXT_PATH % task_id, headers=_if_none_match(entry)
+            )
+            context = self._revalidated(
+                response, entry, self._context_etags, task_id, TaskContext.from_dict
+            )
+            self._context_cache.set(task_id, context)
+        return context
 
     async def context_async(self, task_id: int) -> TaskContext:
         """
@@ -183,14 +522,30 @@ class TasksAPI:
 
         See context() for documentation.
         """
-        data = await self._client._request_json_async("GET", f"/api/tasks/{task_id}/context")
-        return TaskContext.from_dict(data)
+        context = self._context_cache.get(task_id)
+        if context is None:
+            context = await self._context_flights.run(
+                task_id, lambda: self._fetch_context_async(task_id)
+            )
+        return context
+
+    async def _fetch_context_async(self, task_id: int) -> TaskContext:
+        entry = self._context_etags.get(task_id)
+        response = await self._client._request_async(
+            "GET", _CONTEXT_PATH % task_id, headers=_if_none_match(entry)
+        )
+        context = self._revalidated(
+            response, entry, self._context_etags, task_id, TaskContext.from_dict
+        )
+        self._context_cache.set(task_id, context)
+        return context
 
     def update_status(
         self,
         task_id: int,
         status: Union[str, TaskStatus],
-        progress: Optional[dict[str, Any]] = None,
+        progress: Optional[_Payload] = None,
+        force: bool = False,
     ) -> Task:
         """
         Update the status of a task.
@@ -198,7 +553,11 @@ class TasksAPI:
         Args:
             task_id: The task ID to update.
             status: New status (in_progress, review). Note: completed/cancelled are set by the system.
-            progress: Optional progress metadata (e.g., {"step": 3, "total_steps": 5}).
+            progress: Optional progress metadata (e.g., {"step": 3, "total_steps": 5}),
+                as a dict or dataclass instance.
+            force: Send the update even if the cached task already has this status.
+                Without a client cache_ttl there is nothing cached and the update
+                is always sent.
 
         Returns:
             The updated Task.
@@ -218,36 +577,43 @@ class TasksAPI:
             ...     progress={"completed_steps": ["research", "draft", "edit"]}
             ... )
         """
-        body: dict[str, Any] = {
-            "status": status.value if isinstance(status, TaskStatus) else status
-        }
-        if progress is not None:
-            body["progress"] = progress
-
-        data = self._client._request_json("PATCH", f"/api/tasks/{task_id}/status", json=body)
-        return Task.from_dict(data)
+        if not force:
+            cached = self._cached_if_unchanged(task_id, status, progress)
+            if cached is not None:
+                return cached
+        body = _build_status_body(status, progress)
+        try:
+            data = self._client._request_json("PATCH", _STATUS_PATH % task_id, json=body)
+        except CavendoError:
+            self.invalidate(task_id)
+            raise
+        return self._remember(Task.from_dict(data))
 
     async def update_status_async(
         self,
         task_id: int,
         status: Union[str, TaskStatus],
-        progress: Optional[dict[str, Any]] = None,
+        progress: Optional[_Payload] = None,
+        force: bool = False,
     ) -> Task:
         """
         Async version of update_status().
 
         See update_status() for documentation.
         """
-        body: dict[str, Any] = {
-            "status": status.value if isinstance(status, TaskStatus) else status
-        }
-        if progress is not None:
-            body["progress"] = progress
-
-        data = await self._client._request_json_async(
-            "PATCH", f"/api/tasks/{task_id}/status", json=body
-        )
-        return Task.from_dict(data)
+        if not force:
+            cached = self._cached_if_unchanged(task_id, status, progress)
+            if cached is not None:
+                return cached
+        body = _build_status_body(status, progress)
+        try:
+            data = await self._client._request_json_async(
+                "PATCH", _STATUS_PATH % task_id, json=body
+            )
+        except CavendoError:
+            self.invalidate(task_id)
+            raise
+        return self._remember(Task.from_dict(data))
 
     def claim(self, task_id: int) -> Task:
         """
@@ -274,8 +640,8 @@ class TasksAPI:
             ...     print(f"Claimed: {claimed.title}")
             ...     context = client.tasks.context(claimed.id)
         """
-        data = self._client._request_json("POST", f"/api/tasks/{task_id}/claim")
-        return Task.from_dict(data)
+        data = self._client._request_json("POST", _CLAIM_PATH % task_id)
+        return self._remember(Task.from_dict(data))
 
     async def claim_async(self, task_id: int) -> Task:
         """
@@ -283,15 +649,47 @@ class TasksAPI:
 
         See claim() for documentation.
         """
-        data = await self._client._request_json_async("POST", f"/api/tasks/{task_id}/claim")
-        return Task.from_dict(data)
+        data = await self._client._request_json_async("POST", _CLAIM_PATH % task_id)
+        return self._remember(Task.from_dict(data))
+
+    async def next_claim_context_async(self) -> Optional[tuple[Task, TaskContext]]:
+        """
+        Fetch, claim, and load the context of the next task in one call.
+
+        Runs the canonical agent loop (next -> claim -> context) with as few
+        round trips as possible: if the next task is already assigned to this
+        agent, the claim and context requests are issued concurrently. Tasks
+        picked from the unassigned pool are claimed first, since the server
+        only serves context for tasks assigned to the agent.
+
+        Returns:
+            Tuple of (claimed Task, TaskContext), or None if no tasks are available.
+
+        Example:
+            >>> result = await client.tasks.next_claim_context_async()
+            >>> if result:
+            ...     task, context = result
+            ...     print(f"Working on {task.title} in {context.project}")
+        """
+        task = await self.next_async()
+        if task is None:
+            return None
+
+        if task.assignee_id is not None:
+            claimed, context = await asyncio.gather(
+                self.claim_async(task.id), self.context_async(task.id)
+            )
+        else:
+            claimed = await self.claim_async(task.id)
+            context = await self.context_async(task.id)
+        return claimed, context
 
     def log_progress(
         self,
         task_id: int,
         message: str,
         percent_complete: Optional[int] = None,
-        details: Optional[dict[str, Any]] = None,
+        details: Optional[_Payload] = None,
     ) -> dict[str, Any]:
         """
         Log a progress update for a task.
@@ -303,7 +701,8 @@ class TasksAPI:
             task_id: The ID of the task to log progress for.
             message: A description of the progress made.
             percent_complete: Optional completion percentage (0-100).
-            details: Optional additional metadata about the progress.
+            details: Optional additional metadata about the progress, as a dict
+                or dataclass instance.
 
         Returns:
             The created progress log entry.
@@ -318,32 +717,86 @@ class TasksAPI:
             ...     details={"sections_complete": ["intro", "body", "conclusion"]}
             ... )
         """
-        body: dict[str, Any] = {"message": message}
-        if percent_complete is not None:
-            body["percentComplete"] = percent_complete
-        if details is not None:
-            body["details"] = details
-
-        return self._client._request_json("POST", f"/api/tasks/{task_id}/progress", json=body)
+        body = _build_progress_body(message, percent_complete, details)
+        entry = self._client._request_json("POST", _PROGRESS_PATH % task_id, json=body)
+        self.invalidate(task_id)
+        return entry
 
     async def log_progress_async(
         self,
         task_id: int,
         message: str,
         percent_complete: Optional[int] = None,
-        details: Optional[dict[str, Any]] = None,
+        details: Optional[_Payload] = None,
     ) -> dict[str, Any]:
         """
         Async version of log_progress().
 
         See log_progress() for documentation.
         """
-        body: dict[str, Any] = {"message": message}
-        if percent_complete is not None:
-            body["percentComplete"] = percent_complete
-        if details is not None:
-            body["details"] = details
+        body = _build_progress_body(message, percent_complete, details)
+        return await self._post_progress_async(task_id, body)
 
-        return await self._client._request_json_async(
-            "POST", f"/api/tasks/{task_id}/progress", json=body
-        )
+    async def _post_progress_async(self, task_id: int, body: dict[str, Any]) -> dict[str, Any]:
+        entry = await self._client._request_json_async("POST", _PROGRESS_PATH % task_id, json=body)
+        self.invalidate(task_id)
+        return entry
+
+    def start_progress_buffer(self, flush_interval: float = 0.5, max_batch: int = 32) -> None:
+        """
+        Start sending log_progress_nowait() entries from a background task.
+
+        Queued entries are collected for up to ``flush_interval`` seconds (or
+        until ``max_batch`` are waiting) and then sent together: entries for
+        different tasks concurrently, entries for the same task in order. Must
+        be called from a running event loop; call flush_progress() before the
+        loop exits.
+
+        Args:
+            flush_interval: Maximum seconds an entry waits before being sent.
+            max_batch: Maximum number of entries sent per flush.
+
+        Raises:
+            RuntimeError: If a buffer is already running or no event loop is running.
+
+        Example:
+            >>> client.tasks.start_progress_buffer()
+            >>> for i, chunk in enumerate(chunks):
+            ...     process(chunk)
+            ...     client.tasks.log_progress_nowait(123, f"Chunk {i} done")
+            >>> await client.tasks.flush_progress()
+        """
+        if self._progress_buffer is not None:
+            raise RuntimeError("Progress buffer is already running")
+        self._progress_buffer = ProgressBuffer(self._post_progress_async, flush_interval, max_batch)
+
+    def log_progress_nowait(
+        self,
+        task_id: int,
+        message: str,
+        percent_complete: Optional[int] = None,
+        details: Optional[_Payload] = None,
+    ) -> None:
+        """
+        Queue a progress update without waiting for it to be sent.
+
+        Requires start_progress_buffer(). Delivery errors are raised by
+        flush_progress(). See log_progress() for the arguments.
+
+        Raises:
+            RuntimeError: If start_progress_buffer() has not been called.
+        """
+        if self._progress_buffer is None:
+            raise RuntimeError("Call start_progress_buffer() before log_progress_nowait()")
+        self._progress_buffer.put(task_id, _build_progress_body(message, percent_complete, details))
+
+    async def flush_progress(self) -> None:
+        """
+        Send all queued progress updates and stop the background buffer.
+
+        Raises:
+            CavendoError: The first error raised while sending a queued entry.
+        """
+        buffer, self._progress_buffer = self._progress_buffer, None
+        if buffer is not None:
+            await buffer.close()
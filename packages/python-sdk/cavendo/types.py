@@ -5,10 +5,27 @@ This module contains dataclasses and type definitions used throughout
 the SDK to provide structured data and type safety.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Optional, TypedDict
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    TypedDict,
+    TypeVar,
+    cast,
+    overload,
+)
+
+# dataclass(slots=True) requires Python 3.10+; on 3.9 instances keep a __dict__.
+_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_T = TypeVar("_T")
 
 
 class TaskStatus(str, Enum):
@@ -56,6 +73,13 @@ class WebhookEvent(str, Enum):
     BRIEFING_GENERATED = "briefing.generated"
 
 
+# Value -> member tables for tolerant enum parsing in from_dict(). A dict lookup
+# with a default avoids Enum construction and exception handling on every row.
+_TASK_STATUSES = {m.value: m for m in TaskStatus}
+_DELIVERABLE_STATUSES = {m.value: m for m in DeliverableStatus}
+_CONTENT_TYPES = {m.value: m for m in ContentType}
+
+
 class FileAttachment(TypedDict, total=False):
     """
     A file attachment for a deliverable.
@@ -86,7 +110,7 @@ class ActionItem(TypedDict, total=False):
     notes: str  # Optional
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Agent:
     """
     Represents the authenticated agent.
@@ -112,18 +136,19 @@ class Agent:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Agent":
         """Create an Agent from an API response dictionary."""
+        # Positional, in field order (see Task.from_dict)
         return cls(
-            id=data["id"],
-            name=data["name"],
-            type=data.get("type", "ai"),
-            scopes=data.get("scopes", []),
-            project_ids=data.get("projectIds", data.get("project_ids", [])),
-            metadata=data.get("metadata", {}),
-            created_at=_parse_datetime(data.get("createdAt") or data.get("created_at")),
+            data["id"],  # id
+            data["name"],  # name
+            _intern(data.get("type", "ai")),  # type
+            data.get("scopes", []),  # scopes
+            data.get("projectIds", data.get("project_ids", [])),  # project_ids
+            data.get("metadata", {}),  # metadata
+            _parse_datetime(data.get("createdAt", data.get("created_at"))),  # created_at
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Task:
     """
     Represents a task assigned to an agent.
@@ -161,36 +186,40 @@ class Task:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Task":
         """Create a Task from an API response dictionary."""
-        status_value = data.get("status", "pending")
-        try:
-            status = TaskStatus(status_value)
-        except ValueError:
-            status = TaskStatus.PENDING
+        status = _TASK_STATUSES.get(data.get("status", "pending"), TaskStatus.PENDING)
 
+        # Arguments are positional, in field order: binding a dozen keywords
+        # costs more than building the object, and list responses do this per row.
         return cls(
-            id=data["id"],
-            title=data["title"],
-            description=data.get("description"),
-            status=status,
-            priority=data.get("priority", 3),
-            project_id=data.get("projectId") or data.get("project_id"),
-            project_name=data.get("projectName") or data.get("project_name"),
+            data["id"],  # id
+            data["title"],  # title
+            data.get("description"),  # description
+            status,  # status
+            data.get("priority", 3),  # priority
+            data.get("projectId", data.get("project_id")),  # project_id
+            data.get("projectName", data.get("project_name")),  # project_name
             # Server may return assigneeId, assignee_id, assignedAgentId, or assigned_agent_id
-            assignee_id=(
-                data.get("assigneeId")
-                or data.get("assignee_id")
-                or data.get("assignedAgentId")
-                or data.get("assigned_agent_id")
-            ),
-            due_date=_parse_datetime(data.get("dueDate") or data.get("due_date")),
-            progress=data.get("progress", {}),
-            metadata=data.get("metadata", {}),
-            created_at=_parse_datetime(data.get("createdAt") or data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updatedAt") or data.get("updated_at")),
+            data.get(
+                "assigneeId",
+                data.get(
+                    "assignee_id",
+                    data.get("assignedAgentId", data.get("assigned_agent_id")),
+                ),
+            ),  # assignee_id
+            _parse_datetime(data.get("dueDate", data.get("due_date"))),  # due_date
+            data.get("progress", {}),  # progress
+            data.get("metadata", {}),  # metadata
+            _parse_datetime(data.get("createdAt", data.get("created_at"))),  # created_at
+            _parse_datetime(data.get("updatedAt", data.get("updated_at"))),  # updated_at
         )
 
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> list["Task"]:
+        """Create Tasks from a list of API response dictionaries."""
+        return list(map(cls.from_dict, items))
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class AgentProfile:
     """
     Profile information for an agent assigned to a task.
@@ -221,16 +250,16 @@ class AgentProfile:
         return cls(
             id=data["id"],
             name=data["name"],
-            type=data.get("type"),
+            type=_intern(data.get("type")),
             description=data.get("description"),
             capabilities=data.get("capabilities", []),
             specializations=data.get("specializations", {}),
-            system_prompt=data.get("systemPrompt") or data.get("system_prompt"),
+            system_prompt=data.get("systemPrompt", data.get("system_prompt")),
             metadata=data.get("metadata", {}),
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SprintInfo:
     """
     Basic sprint information included in task context.
@@ -252,11 +281,65 @@ class SprintInfo:
         )
 
 
+class _LazyList(Generic[_T]):
+    """
+    Dataclass field descriptor for a list parsed from a raw response on first read.
+
+    Assigning None (the field default) defers parsing; the value is then built
+    by ``parse`` from the instance's ``_raw`` response dict when first accessed.
+    """
+
+    def __init__(self, parse: Callable[[dict[str, Any]], list[_T]]) -> None:
+        self._parse = parse
+        self._attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = "_" + name
+
+    @overload
+    def __get__(self, obj: None, objtype: Any = None) -> None: ...
+
+    @overload
+    def __get__(self, obj: object, objtype: Any = None) -> list[_T]: ...
+
+    def __get__(self, obj: Optional[object], objtype: Any = None) -> Optional[list[_T]]:
+        if obj is None:
+            # Class access: dataclass reads this as the field default
+            return None
+        value: Optional[list[_T]] = obj.__dict__[self._attr]
+        if value is None:
+            value = obj.__dict__[self._attr] = self._parse(obj.__dict__.get("_raw", {}))
+        return value
+
+    def __set__(self, obj: object, value: Optional[list[_T]]) -> None:
+        obj.__dict__[self._attr] = value
+
+
+def _lazy_list(parse: Callable[[dict[str, Any]], list[_T]]) -> list[_T]:
+    """
+    Declare a lazily parsed list field, like ``field()`` does for plain ones.
+
+    Typed as the list it yields so that the field's annotation, and what
+    ``dataclasses.fields()`` and type checkers report, stays ``list[...]``.
+    """
+    return cast("list[_T]", _LazyList(parse))
+
+
+def _previous_deliverables(raw: dict[str, Any]) -> list["Deliverable"]:
+    # Server may return deliverables under "deliverables" or "previousDeliverables"
+    return Deliverable.from_dicts(raw.get("deliverables", raw.get("previousDeliverables", [])))
+
+
 @dataclass
 class TaskContext:
     """
     Extended context for a task, including related information.
 
+    When built by from_dict(), related_tasks, knowledge and previous_deliverables
+    are parsed on first access, so callers that only read the task or project
+    don't pay to decode them. Unlike the other result types this dataclass is not
+    slotted, since the lazy fields keep their parsed values in the instance dict.
+
     Attributes:
         task: The task itself.
         agent: Profile of the agent assigned to the task.
@@ -271,16 +354,15 @@ class TaskContext:
     agent: Optional[AgentProfile] = None
     project: Optional[dict[str, Any]] = None
     sprint: Optional[SprintInfo] = None
-    related_tasks: list[Task] = field(default_factory=list)
-    knowledge: list["KnowledgeDocument"] = field(default_factory=list)
-    previous_deliverables: list["Deliverable"] = field(default_factory=list)
+    related_tasks: list[Task] = _lazy_list(lambda raw: Task.from_dicts(raw.get("relatedTasks", [])))
+    knowledge: list["KnowledgeDocument"] = _lazy_list(
+        lambda raw: KnowledgeDocument.from_dicts(raw.get("knowledge", []))
+    )
+    previous_deliverables: list["Deliverable"] = _lazy_list(_previous_deliverables)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "TaskContext":
         """Create TaskContext from an API response dictionary."""
-        # Server may return deliverables under "deliverables" or "previousDeliverables"
-        deliverables_data = data.get("deliverables", data.get("previousDeliverables", []))
-
         # Parse agent profile if present
         agent_data = data.get("agent")
         agent = AgentProfile.from_dict(agent_data) if agent_data else None
@@ -289,20 +371,18 @@ class TaskContext:
         sprint_data = data.get("sprint")
         sprint = SprintInfo.from_dict(sprint_data) if sprint_data else None
 
-        return cls(
+        context = cls(
             task=Task.from_dict(data["task"]),
             agent=agent,
             project=data.get("project"),
             sprint=sprint,
-            related_tasks=[Task.from_dict(t) for t in data.get("relatedTasks", [])],
-            knowledge=[KnowledgeDocument.from_dict(k) for k in data.get("knowledge", [])],
-            previous_deliverables=[
-                Deliverable.from_dict(d) for d in deliverables_data
-            ],
         )
+        # Kept outside the dataclass fields so asdict() and replace() don't carry it
+        context.__dict__["_raw"] = data
+        return context
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Deliverable:
     """
     Represents a deliverable submitted by an agent.
@@ -345,46 +425,46 @@ class Deliverable:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "Deliverable":
         """Create a Deliverable from an API response dictionary."""
-        content_type_value = data.get("contentType") or data.get("content_type", "markdown")
-        try:
-            content_type = ContentType(content_type_value)
-        except ValueError:
-            content_type = ContentType.MARKDOWN
+        content_type_value = data.get("contentType", data.get("content_type", "markdown"))
+        content_type = _CONTENT_TYPES.get(content_type_value, ContentType.MARKDOWN)
 
         status_value = data.get("status", "pending")
-        try:
-            status = DeliverableStatus(status_value)
-        except ValueError:
-            status = DeliverableStatus.PENDING
+        status = _DELIVERABLE_STATUSES.get(status_value, DeliverableStatus.PENDING)
 
         # Handle task_id - now optional for standalone deliverables
-        task_id_value = data.get("taskId") or data.get("task_id")
+        task_id_value = data.get("taskId", data.get("task_id"))
 
+        # Positional, in field order (see Task.from_dict)
         return cls(
-            id=data["id"],
-            task_id=task_id_value,
-            title=data["title"],
-            content=data.get("content"),
-            content_type=content_type,
-            status=status,
-            version=data.get("version", 1),
-            metadata=data.get("metadata", {}),
-            feedback=data.get("feedback"),
-            summary=data.get("summary"),
-            files=data.get("files"),
-            actions=data.get("actions"),
-            project_id=data.get("projectId") or data.get("project_id"),
-            agent_id=data.get("agentId") or data.get("agent_id"),
-            input_tokens=data.get("inputTokens") or data.get("input_tokens"),
-            output_tokens=data.get("outputTokens") or data.get("output_tokens"),
-            provider=data.get("provider"),
-            model=data.get("model"),
-            created_at=_parse_datetime(data.get("createdAt") or data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updatedAt") or data.get("updated_at")),
+            data["id"],  # id
+            task_id_value,  # task_id
+            data["title"],  # title
+            data.get("content"),  # content
+            content_type,  # content_type
+            status,  # status
+            data.get("version", 1),  # version
+            data.get("metadata", {}),  # metadata
+            data.get("feedback"),  # feedback
+            data.get("summary"),  # summary
+            data.get("files"),  # files
+            data.get("actions"),  # actions
+            data.get("projectId", data.get("project_id")),  # project_id
+            data.get("agentId", data.get("agent_id")),  # agent_id
+            data.get("inputTokens", data.get("input_tokens")),  # input_tokens
+            data.get("outputTokens", data.get("output_tokens")),  # output_tokens
+            _intern(data.get("provider")),  # provider
+            _intern(data.get("model")),  # model
+            _parse_datetime(data.get("createdAt", data.get("created_at"))),  # created_at
+            _parse_datetime(data.get("updatedAt", data.get("updated_at"))),  # updated_at
         )
 
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> list["Deliverable"]:
+        """Create Deliverables from a list of API response dictionaries."""
+        return list(map(cls.from_dict, items))
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Feedback:
     """
     Feedback on a deliverable.
@@ -411,31 +491,29 @@ class Feedback:
     def from_dict(cls, data: dict[str, Any]) -> "Feedback":
         """Create Feedback from an API response dictionary."""
         status_value = data.get("status", "pending")
-        try:
-            status = DeliverableStatus(status_value)
-        except ValueError:
-            status = DeliverableStatus.PENDING
+        status = _DELIVERABLE_STATUSES.get(status_value, DeliverableStatus.PENDING)
 
         # Handle deliverable_id - required field with fallback
-        deliverable_id_value = data.get("deliverableId") or data.get("deliverable_id")
+        deliverable_id_value = data.get("deliverableId", data.get("deliverable_id"))
         if deliverable_id_value is None:
             deliverable_id_value = 0  # Default for missing required field
 
         # Support both "content" and "feedback" keys for the content field
         content_value = data.get("content") or data.get("feedback") or ""
 
+        # Positional, in field order (see Task.from_dict)
         return cls(
-            id=data["id"],
-            deliverable_id=deliverable_id_value,
-            content=content_value,
-            status=status,
-            reviewer_id=data.get("reviewerId") or data.get("reviewer_id"),
-            reviewer_name=data.get("reviewerName") or data.get("reviewer_name"),
-            created_at=_parse_datetime(data.get("createdAt") or data.get("created_at")),
+            data["id"],  # id
+            deliverable_id_value,  # deliverable_id
+            content_value,  # content
+            status,  # status
+            data.get("reviewerId", data.get("reviewer_id")),  # reviewer_id
+            data.get("reviewerName", data.get("reviewer_name")),  # reviewer_name
+            _parse_datetime(data.get("createdAt", data.get("created_at"))),  # created_at
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class KnowledgeDocument:
     """
     A knowledge document from the knowledge base.
@@ -465,26 +543,29 @@ class KnowledgeDocument:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "KnowledgeDocument":
         """Create a KnowledgeDocument from an API response dictionary."""
-        content_type_value = data.get("contentType") or data.get("content_type", "markdown")
-        try:
-            content_type = ContentType(content_type_value)
-        except ValueError:
-            content_type = ContentType.MARKDOWN
+        content_type_value = data.get("contentType", data.get("content_type", "markdown"))
+        content_type = _CONTENT_TYPES.get(content_type_value, ContentType.MARKDOWN)
 
+        # Positional, in field order (see Task.from_dict)
         return cls(
-            id=data["id"],
-            title=data["title"],
-            content=data["content"],
-            content_type=content_type,
-            project_id=data.get("projectId") or data.get("project_id"),
-            tags=data.get("tags", []),
-            metadata=data.get("metadata", {}),
-            created_at=_parse_datetime(data.get("createdAt") or data.get("created_at")),
-            updated_at=_parse_datetime(data.get("updatedAt") or data.get("updated_at")),
+            data["id"],  # id
+            data["title"],  # title
+            data["content"],  # content
+            content_type,  # content_type
+            data.get("projectId", data.get("project_id")),  # project_id
+            data.get("tags", []),  # tags
+            data.get("metadata", {}),  # metadata
+            _parse_datetime(data.get("createdAt", data.get("created_at"))),  # created_at
+            _parse_datetime(data.get("updatedAt", data.get("updated_at"))),  # updated_at
         )
 
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> list["KnowledgeDocument"]:
+        """Create KnowledgeDocuments from a list of API response dictionaries."""
+        return list(map(cls.from_dict, items))
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class SearchResult:
     """
     A search result from the knowledge base.
@@ -502,14 +583,20 @@ class SearchResult:
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "SearchResult":
         """Create a SearchResult from an API response dictionary."""
+        # Positional, in field order (see Task.from_dict)
         return cls(
-            document=KnowledgeDocument.from_dict(data.get("document", data)),
-            score=data.get("score", 0.0),
-            highlights=data.get("highlights", []),
+            KnowledgeDocument.from_dict(data.get("document", data)),  # document
+            data.get("score", 0.0),  # score
+            data.get("highlights", []),  # highlights
         )
 
+    @classmethod
+    def from_dicts(cls, items: Iterable[dict[str, Any]]) -> list["SearchResult"]:
+        """Create SearchResults from a list of API response dictionaries."""
+        return list(map(cls.from_dict, items))
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class Webhook:
     """
     A webhook configuration.
@@ -537,24 +624,42 @@ class Webhook:
         # Convert to boolean "active" for SDK consistency
         status = data.get("status", "active")
         is_active = data.get("active", status == "active")
+        # Positional, in field order (see Task.from_dict)
         return cls(
-            id=data["id"],
-            url=data["url"],
-            events=data.get("events", []),
-            active=is_active,
-            secret=data.get("secret"),
-            created_at=_parse_datetime(data.get("createdAt") or data.get("created_at")),
+            data["id"],  # id
+            data["url"],  # url
+            data.get("events", []),  # events
+            is_active,  # active
+            data.get("secret"),  # secret
+            _parse_datetime(data.get("createdAt", data.get("created_at"))),  # created_at
         )
 
 
+def _unwrap_list(data: Any, key: str) -> list[Any]:
+    """Return the items of a list response (bare array or {key: [...]})."""
+    items: list[Any] = data if data.__class__ is list else data.get(key, [])
+    return items
+
+
+def _intern(value: Any) -> Any:
+    """Intern a short string that repeats across rows (provider, model, agent type)."""
+    return sys.intern(value) if value.__class__ is str else value
+
+
+_fromisoformat = datetime.fromisoformat
+
+# fromisoformat() accepts a trailing "Z" (UTC) from Python 3.11; earlier
+# versions need it rewritten as "+00:00".
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+
 def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     """Parse an ISO format datetime string."""
     if not value:
         return None
     try:
-        # Handle various ISO formats
-        if value.endswith("Z"):
-            value = value[:-1] + "+00:00"
-        return datetime.fromisoformat(value)
+        if _FROMISOFORMAT_ACCEPTS_Z or value[-1] != "Z":
+            return _fromisoformat(value)
+        return _fromisoformat(value[:-1] + "+00:00")
     except (ValueError, TypeError):
         return None
@@ -7,12 +7,48 @@ Note: Webhook management requires the 'webhook:create' scope.
 
 from typing import TYPE_CHECKING, Any, Optional, Union
 
-from .types import Webhook, WebhookEvent
+from .types import Webhook, WebhookEvent, _unwrap_list
 
 if TYPE_CHECKING:
     from .client import CavendoClient
 
 
+# Resource paths, shared by the sync and async variants of each method.
+_WEBHOOK_PATH = "/api/webhooks/mine/%s"
+
+
+def _build_create_body(
+    url: str,
+    events: list[Union[str, WebhookEvent]],
+    active: bool,
+) -> dict[str, Any]:
+    """Build the JSON body for create()."""
+    return {
+        "url": url,
+        # WebhookEvent is a str enum, so members encode as their value.
+        "events": list(events),
+        # Server expects "status" field with "active"/"inactive" values
+        "status": "active" if active else "inactive",
+    }
+
+
+def _build_update_body(
+    url: Optional[str],
+    events: Optional[list[Union[str, WebhookEvent]]],
+    active: Optional[bool],
+) -> dict[str, Any]:
+    """Build the JSON body for update(), omitting unset fields."""
+    body: dict[str, Any] = {}
+    if url is not None:
+        body["url"] = url
+    if events is not None:
+        body["events"] = list(events)
+    if active is not None:
+        # Server expects "status" field with "active"/"inactive" values
+        body["status"] = "active" if active else "inactive"
+    return body
+
+
 class WebhooksAPI:
     """
     API for managing webhooks.
@@ -49,8 +85,7 @@ class WebhooksAPI:
         """
         data = self._client._request_json("GET", "/api/webhooks/mine")
 
-        webhooks_data = data if isinstance(data, list) else data.get("webhooks", [])
-        return [Webhook.from_dict(w) for w in webhooks_data]
+        return [Webhook.from_dict(w) for w in _unwrap_list(data, "webhooks")]
 
     async def list_all_async(self) -> list[Webhook]:
         """
@@ -60,8 +95,7 @@ class WebhooksAPI:
         """
         data = await self._client._request_json_async("GET", "/api/webhooks/mine")
 
-        webhooks_data = data if isinstance(data, list) else data.get("webhooks", [])
-        return [Webhook.from_dict(w) for w in webhooks_data]
+        return [Webhook.from_dict(w) for w in _unwrap_list(data, "webhooks")]
 
     def create(
         self,
@@ -92,14 +126,7 @@ class WebhooksAPI:
             >>> print(f"Created webhook {webhook.id}")
             >>> print(f"Secret: {webhook.secret}")  # Save this!
         """
-        event_values = [e.value if isinstance(e, WebhookEvent) else e for e in events]
-
-        body: dict[str, Any] = {
-            "url": url,
-            "events": event_values,
-            # Server expects "status" field with "active"/"inactive" values
-            "status": "active" if active else "inactive",
-        }
+        body = _build_create_body(url, events, active)
 
         data = self._client._request_json("POST", "/api/webhooks/mine", json=body)
         return Webhook.from_dict(data)
@@ -115,14 +142,7 @@ class WebhooksAPI:
 
         See create() for documentation.
         """
-        event_values = [e.value if isinstance(e, WebhookEvent) else e for e in events]
-
-        body: dict[str, Any] = {
-            "url": url,
-            "events": event_values,
-            # Server expects "status" field with "active"/"inactive" values
-            "status": "active" if active else "inactive",
-        }
+        body = _build_create_body(url, events, active)
 
         data = await self._client._request_json_async("POST", "/api/webhooks/mine", json=body)
         return Webhook.from_dict(data)
@@ -160,16 +180,9 @@ class WebhooksAPI:
             ...     events=["task.assigned"]
             ... )
         """
-        body: dict[str, Any] = {}
-        if url is not None:
-            body["url"] = url
-        if events is not None:
-            body["events"] = [e.value if isinstance(e, WebhookEvent) else e for e in events]
-        if active is not None:
-            # Server expects "status" field with "active"/"inactive" values
-            body["status"] = "active" if active else "inactive"
+        body = _build_update_body(url, events, active)
 
-        data = self._client._request_json("PATCH", f"/api/webhooks/mine/{webhook_id}", json=body)
+        data = self._client._request_json("PATCH", _WEBHOOK_PATH % webhook_id, json=body)
         return Webhook.from_dict(data)
 
     async def update_async(
@@ -184,17 +197,10 @@ class WebhooksAPI:
 
         See update() for documentation.
         """
-        body: dict[str, Any] = {}
-        if url is not None:
-            body["url"] = url
-        if events is not None:
-            body["events"] = [e.value if isinstance(e, WebhookEvent) else e for e in events]
-        if active is not None:
-            # Server expects "status" field with "active"/"inactive" values
-            body["status"] = "active" if active else "inactive"
+        body = _build_update_body(url, events, active)
 
         data = await self._client._request_json_async(
-            "PATCH", f"/api/webhooks/mine/{webhook_id}", json=body
+            "PATCH", _WEBHOOK_PATH % webhook_id, json=body
         )
         return Webhook.from_dict(data)
 
@@ -213,7 +219,7 @@ class WebhooksAPI:
             >>> client.webhooks.delete(1)
             >>> print("Webhook deleted")
         """
-        self._client._request("DELETE", f"/api/webhooks/mine/{webhook_id}")
+        self._client._request("DELETE", _WEBHOOK_PATH % webhook_id)
 
     async def delete_async(self, webhook_id: int) -> None:
         """
@@ -221,4 +227,4 @@ class WebhooksAPI:
 
         See delete() for documentation.
         """
-        await self._client._request_async("DELETE", f"/api/webhooks/mine/{webhook_id}")
+        await self._client._request_async("DELETE", _WEBHOOK_PATH % webhook_id)
@@ -10,9 +10,11 @@ Requirements:
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from cavendo import CavendoClient, TaskStatus, Task, TaskContext
+from cavendo._cache import TTLCache
 
 # CrewAI imports (install with: pip install crewai)
 try:
@@ -23,6 +25,11 @@ except ImportError:
     raise
 
 
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
 class CavendoKnowledgeTool(BaseTool):
     """
     CrewAI tool for searching the Cavendo knowledge base.
@@ -38,9 +45,16 @@ class CavendoKnowledgeTool(BaseTool):
         super().__init__()
         self._client = client
         self._project_id = project_id
+        # Agents in a crew often repeat a query; answer recent repeats without a
+        # round trip, but keep the cache small and let stale results expire.
+        self._cache: TTLCache[str, str] = TTLCache(60.0, maxsize=128)
 
     def _run(self, query: str) -> str:
         """Search the knowledge base."""
+        cached = self._cache.get(query)
+        if cached is not None:
+            return cached
+
         results = self._client.knowledge.search(
             query=query,
             project_id=self._project_id,
@@ -53,9 +67,11 @@ class CavendoKnowledgeTool(BaseTool):
         output = []
         for result in results:
             doc = result.document
-            output.append(f"## {doc.title}\n{doc.content[:500]}...")
+            output.append(f"## {doc.title}\n{_truncate(doc.content, 500)}")
 
-        return "\n\n---\n\n".join(output)
+        formatted = "\n\n---\n\n".join(output)
+        self._cache.set(query, formatted)
+        return formatted
 
 
 class CavendoDeliverableTool(BaseTool):
@@ -77,11 +93,11 @@ class CavendoDeliverableTool(BaseTool):
 
     def _run(self, input_str: str) -> str:
         """Submit a deliverable."""
-        parts = input_str.split("|||", 1)
-        if len(parts) != 2:
+        title, sep, content = input_str.partition("|||")
+        if not sep:
             return "Error: Input must be in format 'TITLE|||CONTENT'"
 
-        title, content = parts[0].strip(), parts[1].strip()
+        title, content = title.strip(), content.strip()
 
         deliverable = self._client.deliverables.submit(
             task_id=self._task_id,
@@ -101,7 +117,9 @@ def create_crew_for_task(
     """
     Create a CrewAI Crew configured for a specific Cavendo task.
     """
-    project_id = context.project.get("id") if context.project else None
+    project = context.project or {}
+    project_id = project.get("id")
+    project_name = project.get("name") or "N/A"
 
     # Create tools
     knowledge_tool = CavendoKnowledgeTool(client, project_id)
@@ -132,15 +150,19 @@ def create_crew_for_task(
     )
 
     # Build the task description with context
+    previous_deliverables = "\n".join(
+        [f"- {d.title}" for d in context.previous_deliverables]
+    ) or "None"
+
     task_description = f"""
     Task: {task.title}
 
     Description: {task.description or 'No additional description provided.'}
 
-    Project Context: {context.project.get('name') if context.project else 'N/A'}
+    Project Context: {project_name}
 
     Previous Deliverables:
-    {chr(10).join(f'- {d.title}' for d in context.previous_deliverables) or 'None'}
+    {previous_deliverables}
 
     Your job is to:
     1. Research the topic using the knowledge base
@@ -177,29 +199,30 @@ def main() -> None:
     """Main function demonstrating CrewAI integration."""
 
     # Initialize Cavendo client
-    client = CavendoClient(
+    with CavendoClient(
         url=os.getenv("CAVENDO_URL", "http://localhost:3001"),
         api_key=os.getenv("CAVENDO_AGENT_KEY"),
-    )
-
-    try:
-        # Get agent info
-        agent = client.me()
-        print(f"Starting CrewAI agent: {agent.name}")
-
-        # Get next task
-        task = client.tasks.next()
-        if not task:
-            print("No tasks available")
-            return
-
-        print(f"\nProcessing task: {task.title}")
-
-        # Mark task as in progress
-        client.tasks.update_status(task.id, TaskStatus.IN_PROGRESS)
-
-        # Get task context
-        context = client.tasks.context(task.id)
+    ) as client:
+        # Independent requests run side by side; the client is thread-safe
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # Get agent info and the next task
+            agent_future = pool.submit(client.me)
+            task = client.tasks.next()
+            agent = agent_future.result()
+            print(f"Starting CrewAI agent: {agent.name}")
+
+            if not task:
+                print("No tasks available")
+                return
+
+            print(f"\nProcessing task: {task.title}")
+
+            # Mark task as in progress while fetching its context
+            status_future = pool.submit(
+                client.tasks.update_status, task.id, TaskStatus.IN_PROGRESS
+            )
+            context = client.tasks.context(task.id)
+            status_future.result()
 
         # Create and run the crew
         crew = create_crew_for_task(client, task, context)
@@ -211,9 +234,6 @@ def main() -> None:
         client.tasks.update_status(task.id, TaskStatus.REVIEW)
         print("Task marked for review")
 
-    finally:
-        client.close()
-
 
 if __name__ == "__main__":
     main()
@@ -10,9 +10,12 @@ Requirements:
 
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Optional, Type
 
-from cavendo import CavendoClient, TaskStatus, Task, TaskContext
+from cavendo import CavendoClient, SearchResult, TaskStatus, Task, TaskContext
+from cavendo._cache import TTLCache
 
 # LangChain imports
 try:
@@ -20,12 +23,22 @@ try:
     from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
     from langchain.tools import BaseTool
     from langchain_openai import ChatOpenAI
-    from pydantic import BaseModel, Field
+    from pydantic import BaseModel, Field, PrivateAttr
 except ImportError:
     print("LangChain not installed. Run: pip install langchain langchain-openai")
     raise
 
 
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to limit characters, marking the cut with an ellipsis."""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+
+# Attached to every deliverable the agent submits. submit() only reads it, so one
+# shared dict serves every call.
+_SUBMIT_METADATA = {"source": "langchain_agent"}
+
+
 # Tool input schemas
 class KnowledgeSearchInput(BaseModel):
     """Input schema for knowledge search."""
@@ -61,39 +74,44 @@ class CavendoKnowledgeSearchTool(BaseTool):
     client: CavendoClient
     project_id: Optional[int] = None
 
+    # Recent formatted results by query; agents often repeat a search within one
+    # task. Small and short-lived so a long-lived tool neither grows nor goes stale.
+    _cache: TTLCache[str, str] = PrivateAttr(
+        default_factory=lambda: TTLCache(60.0, maxsize=128)
+    )
+
     class Config:
         arbitrary_types_allowed = True
 
     def _run(self, query: str) -> str:
         """Execute the knowledge search."""
-        results = self.client.knowledge.search(
-            query=query,
-            project_id=self.project_id,
-            limit=5,
-        )
-
-        if not results:
-            return "No relevant knowledge documents found for your query."
-
-        output_parts = []
-        for i, result in enumerate(results, 1):
-            doc = result.document
-            output_parts.append(
-                f"### Document {i}: {doc.title}\n"
-                f"Relevance Score: {result.score:.2f}\n\n"
-                f"{doc.content[:800]}{'...' if len(doc.content) > 800 else ''}"
+        formatted = self._cache.get(query)
+        if formatted is None:
+            results = self.client.knowledge.search(
+                query=query,
+                project_id=self.project_id,
+                limit=5,
             )
-
-        return "\n\n---\n\n".join(output_parts)
+            formatted = self._format(results)
+            self._cache.set(query, formatted)
+        return formatted
 
     async def _arun(self, query: str) -> str:
         """Async version of the search."""
-        results = await self.client.knowledge.search_async(
-            query=query,
-            project_id=self.project_id,
-            limit=5,
-        )
+        formatted = self._cache.get(query)
+        if formatted is None:
+            results = await self.client.knowledge.search_async(
+                query=query,
+                project_id=self.project_id,
+                limit=5,
+            )
+            formatted = self._format(results)
+            self._cache.set(query, formatted)
+        return formatted
 
+    @staticmethod
+    def _format(results: list[SearchResult]) -> str:
+        """Render search results for the agent."""
         if not results:
             return "No relevant knowledge documents found for your query."
 
@@ -103,7 +121,7 @@ class CavendoKnowledgeSearchTool(BaseTool):
             output_parts.append(
                 f"### Document {i}: {doc.title}\n"
                 f"Relevance Score: {result.score:.2f}\n\n"
-                f"{doc.content[:800]}{'...' if len(doc.content) > 800 else ''}"
+                f"{_truncate(doc.content, 800)}"
             )
 
         return "\n\n---\n\n".join(output_parts)
@@ -132,7 +150,7 @@ class CavendoSubmitDeliverableTool(BaseTool):
             title=title,
             content=content,
             content_type="markdown",
-            metadata={"source": "langchain_agent"},
+            metadata=_SUBMIT_METADATA,
         )
         return f"Successfully submitted deliverable '{title}' with ID: {deliverable.id}"
 
@@ -143,7 +161,7 @@ class CavendoSubmitDeliverableTool(BaseTool):
             title=title,
             content=content,
             content_type="markdown",
-            metadata={"source": "langchain_agent"},
+            metadata=_SUBMIT_METADATA,
         )
         return f"Successfully submitted deliverable '{title}' with ID: {deliverable.id}"
 
@@ -185,6 +203,22 @@ class CavendoUpdateStatusTool(BaseTool):
         return f"Task status updated to: {status}"
 
 
+# Prompt layout shared by every task. The task details are filled in through the
+# system_message variable, so braces in task text aren't parsed as placeholders.
+_PROMPT = ChatPromptTemplate.from_messages([
+    ("system", "{system_message}"),
+    MessagesPlaceholder(variable_name="chat_history", optional=True),
+    ("human", "{input}"),
+    MessagesPlaceholder(variable_name="agent_scratchpad"),
+])
+
+
+@lru_cache(maxsize=None)
+def _default_llm() -> ChatOpenAI:
+    """One default model client per process, so its connection pool is reused across tasks."""
+    return ChatOpenAI(model="gpt-4", temperature=0)
+
+
 def create_agent_for_task(
     client: CavendoClient,
     task: Task,
@@ -195,9 +229,11 @@ def create_agent_for_task(
     Create a LangChain agent configured for a Cavendo task.
     """
     if llm is None:
-        llm = ChatOpenAI(model="gpt-4", temperature=0)
+        llm = _default_llm()
 
-    project_id = context.project.get("id") if context.project else None
+    project = context.project or {}
+    project_id = project.get("id")
+    project_name = project.get("name") or "N/A"
 
     # Create tools
     tools = [
@@ -208,11 +244,11 @@ def create_agent_for_task(
 
     # Build context information
     previous_deliverables = "\n".join(
-        f"- {d.title}" for d in context.previous_deliverables
+        [f"- {d.title}" for d in context.previous_deliverables]
     ) or "None"
 
     related_knowledge = "\n".join(
-        f"- {k.title}" for k in context.knowledge
+        [f"- {k.title}" for k in context.knowledge]
     ) or "Use the knowledge search tool to find relevant information."
 
     # Create the prompt
@@ -221,7 +257,7 @@ def create_agent_for_task(
 Current Task: {task.title}
 Task ID: {task.id}
 Priority: {task.priority}
-Project: {context.project.get('name') if context.project else 'N/A'}
+Project: {project_name}
 
 Task Description:
 {task.description or 'No additional description provided.'}
@@ -241,12 +277,7 @@ Your workflow should be:
 
 Be thorough and professional in your analysis."""
 
-    prompt = ChatPromptTemplate.from_messages([
-        ("system", system_message),
-        MessagesPlaceholder(variable_name="chat_history", optional=True),
-        ("human", "{input}"),
-        MessagesPlaceholder(variable_name="agent_scratchpad"),
-    ])
+    prompt = _PROMPT.partial(system_message=system_message)
 
     # Create the agent
     agent = create_openai_functions_agent(llm, tools, prompt)
@@ -263,18 +294,17 @@ def main() -> None:
     """Main function demonstrating LangChain integration."""
 
     # Initialize Cavendo client
-    client = CavendoClient(
+    with CavendoClient(
         url=os.getenv("CAVENDO_URL", "http://localhost:3001"),
         api_key=os.getenv("CAVENDO_AGENT_KEY"),
-    )
-
-    try:
-        # Get agent info
-        agent_info = client.me()
+    ) as client:
+        # Get agent info and the next task side by side; the client is thread-safe
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            agent_future = pool.submit(client.me)
+            task = client.tasks.next()
+            agent_info = agent_future.result()
         print(f"Starting LangChain agent: {agent_info.name}")
 
-        # Get next task
-        task = client.tasks.next()
         if not task:
             print("No tasks available")
             return
@@ -295,23 +325,17 @@ def main() -> None:
 
         print(f"\nAgent result: {result['output']}")
 
-    finally:
-        client.close()
-
 
 async def main_async() -> None:
     """Async version of main for use with async LangChain patterns."""
 
-    client = CavendoClient(
+    async with CavendoClient(
         url=os.getenv("CAVENDO_URL", "http://localhost:3001"),
         api_key=os.getenv("CAVENDO_AGENT_KEY"),
-    )
-
-    try:
-        agent_info = await client.me_async()
+    ) as client:
+        agent_info, task = await asyncio.gather(client.me_async(), client.tasks.next_async())
         print(f"Starting async LangChain agent: {agent_info.name}")
 
-        task = await client.tasks.next_async()
         if not task:
             print("No tasks available")
             return
@@ -325,9 +349,6 @@ async def main_async() -> None:
 
         print(f"\nAgent result: {result['output']}")
 
-    finally:
-        await client.aclose()
-
 
 if __name__ == "__main__":
     # Use sync version by default
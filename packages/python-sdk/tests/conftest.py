@@ -1,7 +1,6 @@
 """Shared test fixtures for Cavendo SDK tests."""
 
 import pytest
-from pytest_httpx import HTTPXMock
 
 from cavendo import CavendoClient
 
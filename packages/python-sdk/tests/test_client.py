@@ -1,13 +1,22 @@
 """Tests for the CavendoClient class."""
 
+import json
+import pickle
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from cavendo import CavendoClient
+from cavendo import AdaptiveRateLimiter, CavendoClient, TaskStatus
+from cavendo.client import _stdlib_json_dumps
 from cavendo.exceptions import (
     AuthenticationError,
-    CavendoConnectionError,
+    AuthorizationError,
     NotFoundError,
+    RateLimitError,
     ServerError,
     ValidationError,
 )
@@ -33,6 +42,12 @@ class TestClientInitialization:
         with pytest.raises(ValueError, match="API key is required"):
             CavendoClient(url="http://example.com")
 
+    def test_init_with_pool_size(self) -> None:
+        """Test that pool_size sizes the shared connection pool."""
+        client = CavendoClient(url="http://example.com", api_key="test_key", pool_size=8)
+        assert client._limits.max_connections == 8
+        assert client._limits.max_keepalive_connections == 8
+
     def test_init_with_env_variables(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test client initialization from environment variables."""
         monkeypatch.setenv("CAVENDO_URL", "http://env-url.com")
@@ -97,6 +112,37 @@ class TestClientContextManager:
             assert client is not None
 
 
+class TestClientConnect:
+    """Tests for connection warm-up."""
+
+    def test_connect_sends_health_check(self, client: CavendoClient, httpx_mock: HTTPXMock) -> None:
+        """Test that connect() issues a HEAD request to the health endpoint."""
+        httpx_mock.add_response(method="HEAD", url="http://localhost:3001/health")
+        client.connect()
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.method == "HEAD"
+        assert "X-Agent-Key" not in request.headers
+
+    async def test_aconnect_omits_agent_key(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that aconnect() sends the health check without the agent key."""
+        httpx_mock.add_response(method="HEAD", url="http://localhost:3001/health")
+        await client.aconnect()
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert "X-Agent-Key" not in request.headers
+        assert request.headers["Accept"] == "application/json"
+
+    async def test_aconnect_ignores_errors(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that aconnect() swallows connection failures."""
+        httpx_mock.add_exception(httpx.ConnectError("refused"))
+        await client.aconnect()
+
+
 class TestErrorHandling:
     """Tests for error handling."""
 
@@ -111,6 +157,17 @@ class TestErrorHandling:
         with pytest.raises(NotFoundError):
             client.me()
 
+    def test_authorization_error(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that 403 raises AuthorizationError."""
+        httpx_mock.add_response(
+            status_code=403,
+            json={"success": False, "error": "Forbidden"},
+        )
+        with pytest.raises(AuthorizationError, match="Forbidden"):
+            client.me()
+
     def test_validation_error(
         self, client: CavendoClient, httpx_mock: HTTPXMock
     ) -> None:
@@ -132,3 +189,222 @@ class TestErrorHandling:
         )
         with pytest.raises(ServerError):
             no_retry_client.me()
+
+    def test_errors_use_slots_and_survive_pickling(self) -> None:
+        """Test that slotted errors keep their attributes through pickle."""
+        error = ValidationError("Invalid", 422, {"error": "Invalid"}, {"title": ["required"]})
+        restored = pickle.loads(pickle.dumps(error))
+        assert type(restored) is ValidationError
+        assert restored.status_code == 422
+        assert restored.response_body == {"error": "Invalid"}
+        assert restored.errors == {"title": ["required"]}
+        assert "errors" in ValidationError.__slots__
+
+
+class TestRetryPolicy:
+    """Tests for retry classification and backoff."""
+
+    def test_client_errors_are_not_retried(self, client: CavendoClient) -> None:
+        """Test that 4xx client errors are never retried."""
+        should_retry, _ = client._classify_exception(NotFoundError(), 0)
+        assert should_retry is False
+
+    def test_server_error_uses_backoff_table(self, client: CavendoClient) -> None:
+        """Test that server errors back off using the precomputed table plus jitter."""
+        should_retry, wait_time = client._classify_exception(ServerError(), 2)
+        assert should_retry is True
+        assert 4 <= wait_time <= 4.5
+
+    def test_rate_limit_honors_retry_after(self, client: CavendoClient) -> None:
+        """Test that RateLimitError waits for the server-provided Retry-After."""
+        should_retry, wait_time = client._classify_exception(RateLimitError(retry_after=7), 0)
+        assert should_retry is True
+        assert wait_time == 7
+
+    def test_stops_when_retries_exhausted(self, client: CavendoClient) -> None:
+        """Test that no retry is attempted once max_retries is reached."""
+        should_retry, _ = client._classify_exception(ServerError(), client._max_retries)
+        assert should_retry is False
+
+    def test_no_retry_past_deadline(self, client: CavendoClient) -> None:
+        """Test that a retry whose backoff would end past the deadline is not attempted."""
+        should_retry, _ = client._classify_exception(
+            RateLimitError(retry_after=7), 0, deadline=time.monotonic() + 5
+        )
+        assert should_retry is False
+
+    def test_request_retries_stop_at_deadline(
+        self,
+        api_key: str,
+        base_url: str,
+        httpx_mock: HTTPXMock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that total backoff stays within retry_deadline regardless of max_retries."""
+        now = [1000.0]
+        sleeps: list[float] = []
+
+        def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+            now[0] += delay
+
+        monkeypatch.setattr("cavendo.client.time.monotonic", lambda: now[0])
+        monkeypatch.setattr("cavendo.client.time.sleep", fake_sleep)
+        httpx_mock.add_response(
+            status_code=500, json={"success": False, "error": "boom"}, is_reusable=True
+        )
+        client = CavendoClient(url=base_url, api_key=api_key, max_retries=10, retry_deadline=30)
+        with pytest.raises(ServerError):
+            client.me()
+        # Backoffs of 1, 2, 4 and 8s fit in 30s; the next 16s one would not
+        assert len(sleeps) == 4
+        assert sum(sleeps) <= 30
+        assert len(httpx_mock.get_requests()) == 5
+
+    def test_request_retries_server_errors(
+        self,
+        client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_agent_response: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a transient 500 is retried and the next response returned."""
+        sleeps: list[float] = []
+        monkeypatch.setattr("cavendo.client.time.sleep", sleeps.append)
+        httpx_mock.add_response(status_code=500, json={"success": False, "error": "boom"})
+        httpx_mock.add_response(json=mock_agent_response)
+        agent = client.me()
+        assert agent.id == 1
+        assert len(sleeps) == 1
+
+    async def test_async_retry_does_not_block_event_loop(
+        self,
+        client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_agent_response: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that async retries back off with asyncio.sleep, never time.sleep."""
+        async_sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            async_sleeps.append(delay)
+
+        def blocking_sleep(delay: float) -> None:
+            raise AssertionError("time.sleep called from async request path")
+
+        monkeypatch.setattr("cavendo.client.asyncio.sleep", fake_sleep)
+        monkeypatch.setattr("cavendo.client.time.sleep", blocking_sleep)
+        httpx_mock.add_response(status_code=503, json={"success": False, "error": "busy"})
+        httpx_mock.add_response(json=mock_agent_response)
+        agent = await client.me_async()
+        assert agent.id == 1
+        assert len(async_sleeps) == 1
+
+
+class TestResponseParsing:
+    """Tests for response body parsing."""
+
+    def test_invalid_json_raises_server_error(
+        self, no_retry_client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that a non-JSON success body raises ServerError."""
+        httpx_mock.add_response(content=b"<html>not json</html>")
+        with pytest.raises(ServerError, match="Invalid JSON"):
+            no_retry_client.me()
+
+    def test_empty_body_returns_none(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that 204/empty responses are not parsed as JSON."""
+        httpx_mock.add_response(status_code=204)
+        assert client._request_json("POST", "/api/tasks/1/progress") is None
+
+
+class TestRequestEncoding:
+    """Tests for request body encoding."""
+
+    def test_stdlib_fallback_encodes_enums_and_datetimes(self) -> None:
+        """Test that the stdlib encoder fallback handles enums and datetimes."""
+        encoded = _stdlib_json_dumps(
+            {"status": TaskStatus.REVIEW, "at": datetime(2025, 1, 1, tzinfo=timezone.utc)}
+        )
+        assert json.loads(encoded) == {"status": "review", "at": "2025-01-01T00:00:00+00:00"}
+
+    def test_stdlib_fallback_encodes_dataclasses(self) -> None:
+        """Test that the stdlib encoder fallback handles dataclass payloads."""
+
+        @dataclass
+        class Details:
+            step: int
+            status: TaskStatus
+
+        encoded = _stdlib_json_dumps({"details": Details(2, TaskStatus.REVIEW)})
+        assert json.loads(encoded) == {"details": {"step": 2, "status": "review"}}
+
+    def test_requests_accept_compressed_responses(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_agent_response: dict
+    ) -> None:
+        """Test that the client's default headers keep response compression negotiated."""
+        httpx_mock.add_response(json=mock_agent_response)
+        client.me()
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert "gzip" in request.headers["Accept-Encoding"]
+
+
+class TestAdaptiveRateLimiter:
+    """Tests for the client-side adaptive rate limiter."""
+
+    def test_success_increases_limit(self) -> None:
+        """Test that successful responses additively raise the limit."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=4)
+        limiter.acquire()
+        limiter.release(httpx.Response(200))
+        assert limiter.limit == pytest.approx(4.25)
+        assert limiter.in_flight == 0
+
+    def test_throttling_halves_limit(self) -> None:
+        """Test that 429 and 5xx responses multiplicatively cut the limit."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=8, min_concurrency=2)
+        for status_code in (503, 429, 500):
+            limiter.acquire()
+            limiter.release(httpx.Response(status_code))
+        assert limiter.limit == 2
+
+    def test_exhausted_window_blocks_until_reset(self) -> None:
+        """Test that RateLimit-Remaining: 0 pauses new requests until reset."""
+        limiter = AdaptiveRateLimiter()
+        limiter.acquire()
+        limiter.release(
+            httpx.Response(200, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "30"})
+        )
+        assert 29 < (limiter._wait_time() or 0) <= 30
+
+    def test_invalid_bounds(self) -> None:
+        """Test that inconsistent bounds are rejected."""
+        with pytest.raises(ValueError):
+            AdaptiveRateLimiter(min_concurrency=10, max_concurrency=5)
+
+    def test_client_feeds_responses_to_limiter(
+        self, api_key: str, base_url: str, httpx_mock: HTTPXMock, mock_agent_response: dict
+    ) -> None:
+        """Test that the client acquires a slot per request and reports the outcome."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=4)
+        client = CavendoClient(url=base_url, api_key=api_key, rate_limiter=limiter)
+        httpx_mock.add_response(json=mock_agent_response)
+        client.me()
+        assert limiter.in_flight == 0
+        assert limiter.limit > 4
+
+    async def test_async_client_uses_limiter(
+        self, api_key: str, base_url: str, httpx_mock: HTTPXMock, mock_agent_response: dict
+    ) -> None:
+        """Test that async requests go through the limiter too."""
+        limiter = AdaptiveRateLimiter(initial_concurrency=4)
+        client = CavendoClient(url=base_url, api_key=api_key, rate_limiter=limiter)
+        httpx_mock.add_response(json=mock_agent_response)
+        await client.me_async()
+        await client.aclose()
+        assert limiter.in_flight == 0
+        assert limiter.limit > 4
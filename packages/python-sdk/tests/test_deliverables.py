@@ -1,10 +1,13 @@
 """Tests for the DeliverablesAPI class."""
 
+import json
+
 import pytest
 from pytest_httpx import HTTPXMock
 
 from cavendo import CavendoClient
-from cavendo.types import ContentType, Deliverable, Feedback
+from cavendo.exceptions import ValidationError
+from cavendo.types import ContentType, Deliverable, DeliverableStatus, Feedback
 
 
 class TestDeliverablesSubmit:
@@ -37,6 +40,7 @@ class TestDeliverablesSubmit:
         )
         request = httpx_mock.get_request()
         assert request is not None
+        assert json.loads(request.content)["contentType"] == "code"
 
     def test_submit_with_metadata(
         self, client: CavendoClient, httpx_mock: HTTPXMock, mock_deliverable_response: dict
@@ -51,6 +55,20 @@ class TestDeliverablesSubmit:
         )
         request = httpx_mock.get_request()
         assert request is not None
+        assert json.loads(request.content)["metadata"] == {"sources": ["https://example.com"]}
+
+    def test_submit_rejects_oversized_file_before_sending(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that files over the server limit fail without making a request."""
+        big = "base64:" + "A" * (10 * 1024 * 1024)
+        with pytest.raises(ValidationError, match="exceeds maximum size"):
+            client.deliverables.submit(
+                task_id=123,
+                title="Test",
+                files=[{"filename": "big.bin", "content": big}],
+            )
+        assert httpx_mock.get_requests() == []
 
 
 class TestDeliverablesGet:
@@ -98,6 +116,17 @@ class TestDeliverablesGetFeedback:
         feedback = client.deliverables.get_feedback(456)
         assert feedback is None
 
+    def test_get_feedback_skips_decode_for_unreviewed(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an unreviewed deliverable returns None without parsing JSON."""
+        monkeypatch.setattr(client, "_extract_data", pytest.fail)
+        httpx_mock.add_response(
+            content=b'{"success":true,"data":{"id":456,"status":"pending",'
+            b'"feedback":null,"reviewedBy":null,"reviewedAt":null}}'
+        )
+        assert client.deliverables.get_feedback(456) is None
+
 
 class TestDeliverablesSubmitRevision:
     """Tests for deliverables.submit_revision() method."""
@@ -106,8 +135,7 @@ class TestDeliverablesSubmitRevision:
         self, client: CavendoClient, httpx_mock: HTTPXMock, mock_deliverable_response: dict
     ) -> None:
         """Test that submit_revision() returns updated Deliverable."""
-        revised = mock_deliverable_response.copy()
-        revised["data"]["version"] = 2
+        revised = {"success": True, "data": {**mock_deliverable_response["data"], "version": 2}}
         httpx_mock.add_response(json=revised)
         deliverable = client.deliverables.submit_revision(
             deliverable_id=456,
@@ -139,5 +167,53 @@ class TestDeliverablesMine:
         client.deliverables.mine(status="pending", task_id=123)
         request = httpx_mock.get_request()
         assert request is not None
-        assert "status=pending" in str(request.url)
-        assert "taskId=123" in str(request.url)
+        assert dict(request.url.params) == {
+            "status": "pending",
+            "taskId": "123",
+            "limit": "50",
+            "offset": "0",
+        }
+
+    def test_mine_with_status_enum(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that a DeliverableStatus filter is sent as its wire value."""
+        httpx_mock.add_response(json={"success": True, "data": []})
+        client.deliverables.mine(status=DeliverableStatus.REVISION_REQUESTED)
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.url.params["status"] == "revision_requested"
+
+
+class TestDeliverablesBatch:
+    """Tests for the *_many_async() batch methods."""
+
+    async def test_get_feedback_many_async_preserves_order(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that get_feedback_many_async() returns one result per ID, in order."""
+        for deliverable_id in (1, 2):
+            httpx_mock.add_response(
+                url=f"http://localhost:3001/api/deliverables/{deliverable_id}/feedback",
+                json={
+                    "success": True,
+                    "data": {"id": deliverable_id, "status": "approved", "feedback": "ok"},
+                },
+            )
+        httpx_mock.add_response(
+            url="http://localhost:3001/api/deliverables/3/feedback",
+            json={"success": True, "data": {}},
+        )
+        results = await client.deliverables.get_feedback_many_async([1, 2, 3], max_concurrency=2)
+        assert [f.id if f else None for f in results] == [1, 2, None]
+
+    async def test_submit_many_async(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_deliverable_response: dict
+    ) -> None:
+        """Test that submit_many_async() submits each entry."""
+        httpx_mock.add_response(json=mock_deliverable_response, is_reusable=True)
+        results = await client.deliverables.submit_many_async(
+            [{"task_id": 123, "title": "A"}, {"task_id": 123, "title": "B"}]
+        )
+        assert len(results) == 2
+        assert len(httpx_mock.get_requests()) == 2
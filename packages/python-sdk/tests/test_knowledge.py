@@ -1,6 +1,5 @@
 """Tests for the KnowledgeAPI class."""
 
-import pytest
 from pytest_httpx import HTTPXMock
 
 from cavendo import CavendoClient
@@ -35,9 +34,12 @@ class TestKnowledgeSearch:
         client.knowledge.search("query", project_id=1, tags=["test", "docs"])
         request = httpx_mock.get_request()
         assert request is not None
-        assert "q=query" in str(request.url)
-        assert "projectId=1" in str(request.url)
-        assert "tags=test%2Cdocs" in str(request.url) or "tags=test,docs" in str(request.url)
+        assert dict(request.url.params) == {
+            "q": "query",
+            "limit": "10",
+            "projectId": "1",
+            "tags": "test,docs",
+        }
 
 
 class TestKnowledgeGet:
@@ -76,9 +78,7 @@ class TestKnowledgeListAll:
         client.knowledge.list_all(project_id=1, limit=10, offset=20)
         request = httpx_mock.get_request()
         assert request is not None
-        assert "projectId=1" in str(request.url)
-        assert "limit=10" in str(request.url)
-        assert "offset=20" in str(request.url)
+        assert dict(request.url.params) == {"projectId": "1", "limit": "10", "offset": "20"}
 
     def test_list_all_handles_array_response(
         self, client: CavendoClient, httpx_mock: HTTPXMock, mock_knowledge_response: dict
@@ -87,3 +87,16 @@ class TestKnowledgeListAll:
         httpx_mock.add_response(json=[mock_knowledge_response["data"]])
         docs = client.knowledge.list_all()
         assert len(docs) == 1
+
+
+class TestKnowledgeSearchMany:
+    """Tests for knowledge.search_many_async() method."""
+
+    async def test_search_many_async_returns_one_list_per_query(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that search_many_async() returns results per query."""
+        httpx_mock.add_response(json={"success": True, "data": []}, is_reusable=True)
+        results = await client.knowledge.search_many_async(["a", "b", "c"], project_id=1)
+        assert results == [[], [], []]
+        assert len(httpx_mock.get_requests()) == 3
@@ -1,10 +1,17 @@
 """Tests for the TasksAPI class."""
 
+import asyncio
+import json
+from dataclasses import dataclass
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
 from cavendo import CavendoClient
-from cavendo.types import Task, TaskContext
+from cavendo._cache import TTLCache
+from cavendo.exceptions import NotFoundError
+from cavendo.types import Task, TaskContext, TaskStatus
 
 
 class TestTasksListAll:
@@ -30,9 +37,12 @@ class TestTasksListAll:
         client.tasks.list_all(status="pending", project_id=1, limit=10)
         request = httpx_mock.get_request()
         assert request is not None
-        assert "status=pending" in str(request.url)
-        assert "projectId=1" in str(request.url)
-        assert "limit=10" in str(request.url)
+        assert dict(request.url.params) == {
+            "status": "pending",
+            "projectId": "1",
+            "limit": "10",
+            "offset": "0",
+        }
 
     def test_list_all_handles_array_response(
         self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
@@ -42,6 +52,113 @@ class TestTasksListAll:
         tasks = client.tasks.list_all()
         assert len(tasks) == 1
 
+    def test_list_all_sends_default_paging(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that an unfiltered list_all() still sends the default limit/offset."""
+        httpx_mock.add_response(json={"success": True, "data": []})
+        client.tasks.list_all()
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert dict(request.url.params) == {"limit": "50", "offset": "0"}
+
+
+def _serve_tasks(httpx_mock: HTTPXMock, count: int) -> None:
+    """Serve ``count`` tasks, honoring limit/offset and clamping limit to 500 like the server."""
+    all_tasks = [{"id": i, "title": f"Task {i}"} for i in range(count)]
+
+    def page(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params["offset"])
+        limit = min(int(request.url.params["limit"]), 500)
+        return httpx.Response(
+            200, json={"success": True, "data": all_tasks[offset : offset + limit]}
+        )
+
+    httpx_mock.add_callback(page, is_reusable=True)
+
+
+class TestTasksListAllPaged:
+    """Tests for tasks.list_all_paged_async() method."""
+
+    async def test_fetches_pages_until_short_page(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that pages are fetched in waves and flattened in order."""
+        _serve_tasks(httpx_mock, 5)
+        tasks = await client.tasks.list_all_paged_async(page_size=2, max_concurrency=2)
+        assert [t.id for t in tasks] == [0, 1, 2, 3, 4]
+        assert len(httpx_mock.get_requests()) == 3
+
+    async def test_single_short_page(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that a first page shorter than page_size ends pagination."""
+        httpx_mock.add_response(json={"success": True, "data": [mock_task_response["data"]]})
+        tasks = await client.tasks.list_all_paged_async(status="pending")
+        assert len(tasks) == 1
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_page_size_above_server_cap_is_clamped(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that page_size over 500 still returns every task from a clamping server."""
+        _serve_tasks(httpx_mock, 1200)
+        tasks = await client.tasks.list_all_paged_async(page_size=1000)
+        assert [t.id for t in tasks] == list(range(1200))
+        assert {r.url.params["limit"] for r in httpx_mock.get_requests()} == {"500"}
+
+
+class TestTasksIterAll:
+    """Tests for tasks.iter_all_async() method."""
+
+    async def test_yields_all_tasks_in_order(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that iteration walks every page and stops after a short page."""
+        _serve_tasks(httpx_mock, 5)
+        ids = [task.id async for task in client.tasks.iter_all_async(page_size=2)]
+        assert ids == [0, 1, 2, 3, 4]
+        assert len(httpx_mock.get_requests()) == 3
+
+    async def test_page_size_above_server_cap_is_clamped(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that page_size over 500 still yields every task from a clamping server."""
+        _serve_tasks(httpx_mock, 1200)
+        ids = [task.id async for task in client.tasks.iter_all_async(page_size=1000)]
+        assert ids == list(range(1200))
+        assert {r.url.params["limit"] for r in httpx_mock.get_requests()} == {"500"}
+
+    async def test_early_exit_cancels_prefetch(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that closing the iterator cancels the in-flight prefetch and stops paging."""
+        prefetch_started = asyncio.Event()
+        prefetch_cancelled = asyncio.Event()
+
+        first_page = [{"id": 0, "title": "Task 0"}, {"id": 1, "title": "Task 1"}]
+
+        async def page(request: httpx.Request) -> httpx.Response:
+            if request.url.params["offset"] == "0":
+                return httpx.Response(200, json={"success": True, "data": first_page})
+            prefetch_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                prefetch_cancelled.set()
+                raise
+            raise AssertionError("prefetch was not cancelled")
+
+        httpx_mock.add_callback(page, is_reusable=True)
+        iterator = client.tasks.iter_all_async(page_size=2)
+        first = await iterator.__anext__()
+        await prefetch_started.wait()
+        await iterator.aclose()
+        await asyncio.wait_for(prefetch_cancelled.wait(), timeout=1)
+
+        assert first.id == 0
+        assert [r.url.params["offset"] for r in httpx_mock.get_requests()] == ["0", "2"]
+
 
 class TestTasksNext:
     """Tests for tasks.next() method."""
@@ -69,6 +186,37 @@ class TestTasksNext:
         assert task is None
 
 
+class TestTasksPollNext:
+    """Tests for tasks.poll_next_async() method."""
+
+    async def test_backs_off_while_idle(
+        self,
+        client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_task_response: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that empty polls back off exponentially and reset after a task."""
+        sleeps: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            sleeps.append(delay)
+
+        monkeypatch.setattr("cavendo.tasks.asyncio.sleep", fake_sleep)
+        empty = {"success": True, "data": {"task": None, "reason": "No pending tasks"}}
+        for _ in range(3):
+            httpx_mock.add_response(json=empty)
+        httpx_mock.add_response(
+            json={"success": True, "data": {"task": mock_task_response["data"]}}
+        )
+
+        polls = client.tasks.poll_next_async(min_interval=1, max_interval=3)
+        task = await polls.__anext__()
+        await polls.aclose()
+        assert task.id == 123
+        assert sleeps == [1, 2, 3]
+
+
 class TestTasksGet:
     """Tests for tasks.get() method."""
 
@@ -112,6 +260,56 @@ class TestTasksContext:
         assert context.project["name"] == "Test Project"
 
 
+class TestTasksNextClaimContext:
+    """Tests for tasks.next_claim_context_async() method."""
+
+    def _mock_loop(self, httpx_mock: HTTPXMock, task_data: dict) -> None:
+        base = "http://localhost:3001"
+        httpx_mock.add_response(
+            url=f"{base}/api/agents/me/tasks/next",
+            json={"success": True, "data": {"task": task_data}},
+        )
+        httpx_mock.add_response(
+            url=f"{base}/api/tasks/123/claim", json={"success": True, "data": task_data}
+        )
+        httpx_mock.add_response(
+            url=f"{base}/api/tasks/123/context",
+            json={"success": True, "data": {"task": task_data, "project": {"name": "P"}}},
+        )
+
+    async def test_returns_claimed_task_and_context(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test the combined loop for a task already assigned to the agent."""
+        self._mock_loop(httpx_mock, mock_task_response["data"])
+        result = await client.tasks.next_claim_context_async()
+        assert result is not None
+        task, context = result
+        assert task.id == 123
+        assert context.project["name"] == "P"
+
+    async def test_unassigned_task_is_claimed_before_context(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that pool tasks are claimed before their context is requested."""
+        task_data = {**mock_task_response["data"], "assignedAgentId": None}
+        self._mock_loop(httpx_mock, task_data)
+        await client.tasks.next_claim_context_async()
+        paths = [request.url.path for request in httpx_mock.get_requests()]
+        assert paths == [
+            "/api/agents/me/tasks/next",
+            "/api/tasks/123/claim",
+            "/api/tasks/123/context",
+        ]
+
+    async def test_returns_none_when_no_task(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that no claim or context request is made when next() is empty."""
+        httpx_mock.add_response(json={"success": True, "data": {"task": None}})
+        assert await client.tasks.next_claim_context_async() is None
+
+
 class TestTasksUpdateStatus:
     """Tests for tasks.update_status() method."""
 
@@ -119,8 +317,7 @@ class TestTasksUpdateStatus:
         self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
     ) -> None:
         """Test that update_status() returns the updated task."""
-        updated = mock_task_response.copy()
-        updated["data"]["status"] = "in_progress"
+        updated = {"success": True, "data": {**mock_task_response["data"], "status": "in_progress"}}
         httpx_mock.add_response(json=updated)
         task = client.tasks.update_status(123, "in_progress")
         assert task.status == "in_progress"
@@ -134,3 +331,321 @@ class TestTasksUpdateStatus:
         request = httpx_mock.get_request()
         assert request is not None
         # Verify progress was sent in request body
+
+
+class TestTasksConnectionReuse:
+    """Tests that a task lifecycle shares one pooled HTTP client."""
+
+    def test_sync_calls_share_one_client(
+        self,
+        client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_task_response: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that get -> claim -> update_status reuse a single httpx.Client."""
+        created: list[httpx.Client] = []
+        real_client = httpx.Client
+
+        def tracking_client(*args: object, **kwargs: object) -> httpx.Client:
+            created.append(real_client(*args, **kwargs))  # type: ignore[arg-type]
+            return created[-1]
+
+        monkeypatch.setattr("cavendo.client.httpx.Client", tracking_client)
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        client.tasks.get(123)
+        client.tasks.claim(123)
+        client.tasks.update_status(123, "in_progress")
+        assert len(created) == 1
+        assert len(httpx_mock.get_requests()) == 3
+
+    async def test_async_calls_share_one_client(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that async task calls reuse the client's AsyncClient until aclose()."""
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        await client.tasks.get_async(123)
+        async_client = client._async_client
+        await client.tasks.claim_async(123)
+        assert client._async_client is async_client
+        await client.aclose()
+        assert async_client is not None and async_client.is_closed
+
+
+class TestTasksCache:
+    """Tests for the opt-in get()/context() cache."""
+
+    @pytest.fixture
+    def cached_client(self, api_key: str, base_url: str) -> CavendoClient:
+        """Create a test client with task caching enabled."""
+        return CavendoClient(url=base_url, api_key=api_key, cache_ttl=30)
+
+    def test_get_is_not_cached_by_default(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that repeated get() calls hit the API when caching is off."""
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        client.tasks.get(123)
+        client.tasks.get(123)
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_get_is_cached_until_write(
+        self, cached_client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that get() is served from cache and a write invalidates it."""
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        first = cached_client.tasks.get(123)
+        assert await cached_client.tasks.get_async(123) is first
+        assert len(httpx_mock.get_requests()) == 1
+
+        cached_client.tasks.log_progress(123, "step")
+        cached_client.tasks.get(123)
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_update_status_refreshes_cached_task(
+        self, cached_client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that get() after update_status() returns the updated task without a request."""
+        updated = {"success": True, "data": {**mock_task_response["data"], "status": "in_progress"}}
+        httpx_mock.add_response(json=mock_task_response)
+        httpx_mock.add_response(json=updated)
+        cached_client.tasks.get(123)
+        cached_client.tasks.update_status(123, "in_progress")
+        assert cached_client.tasks.get(123).status == TaskStatus.IN_PROGRESS
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_update_status_skips_no_op(
+        self, cached_client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that a status the cached task already has is not re-sent unless forced."""
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        task = cached_client.tasks.get(123)
+        assert cached_client.tasks.update_status(123, TaskStatus.PENDING) is task
+        assert await cached_client.tasks.update_status_async(123, "pending") is task
+        assert len(httpx_mock.get_requests()) == 1
+
+        cached_client.tasks.update_status(123, "pending", force=True)
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_update_status_error_invalidates(
+        self, cached_client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that a failed update drops the cached task."""
+        httpx_mock.add_response(json=mock_task_response)
+        httpx_mock.add_response(status_code=404, json={"error": "Task not found"})
+        httpx_mock.add_response(json=mock_task_response)
+        cached_client.tasks.get(123)
+        with pytest.raises(NotFoundError):
+            cached_client.tasks.update_status(123, "in_progress")
+        cached_client.tasks.get(123)
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_entries_expire(
+        self,
+        cached_client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_task_response: dict,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that cached entries are refetched once the TTL has elapsed."""
+        now = [1000.0]
+        monkeypatch.setattr("cavendo._cache.time.monotonic", lambda: now[0])
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        cached_client.tasks.get(123)
+        now[0] += 31
+        cached_client.tasks.get(123)
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestTasksSingleFlight:
+    """Tests for coalescing of concurrent identical async reads."""
+
+    async def test_concurrent_get_async_shares_request(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that simultaneous get_async() calls for one task make one request."""
+        httpx_mock.add_response(json=mock_task_response)
+        tasks = await asyncio.gather(*(client.tasks.get_async(123) for _ in range(3)))
+        assert len(httpx_mock.get_requests()) == 1
+        assert all(t is tasks[0] for t in tasks)
+
+    async def test_concurrent_context_async_shares_error(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that every waiting caller receives the shared request's error."""
+        httpx_mock.add_response(status_code=404, json={"error": "Task not found"})
+        results = await asyncio.gather(
+            client.tasks.context_async(999),
+            client.tasks.context_async(999),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, NotFoundError) for r in results)
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_concurrent_list_all_async_returns_separate_lists(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that coalesced list_all_async() callers each get their own list."""
+        httpx_mock.add_response(json={"success": True, "data": [mock_task_response["data"]]})
+        first, second = await asyncio.gather(
+            client.tasks.list_all_async(status="pending"),
+            client.tasks.list_all_async(status="pending"),
+        )
+        assert first == second
+        assert first is not second
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_sequential_calls_are_not_coalesced(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that a call made after the previous one finished hits the API again."""
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        await client.tasks.get_async(123)
+        await client.tasks.get_async(123)
+        assert len(httpx_mock.get_requests()) == 2
+
+
+class TestTasksETag:
+    """Tests for If-None-Match revalidation in get() and context()."""
+
+    @pytest.fixture
+    def revalidating_client(self, api_key: str, base_url: str) -> CavendoClient:
+        """Create a test client with ETag revalidation enabled."""
+        return CavendoClient(url=base_url, api_key=api_key, revalidate=True)
+
+    def test_get_reuses_task_on_not_modified(
+        self,
+        revalidating_client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_task_response: dict,
+    ) -> None:
+        """Test that a 304 response returns a copy of the previously decoded Task."""
+        httpx_mock.add_response(json=mock_task_response, headers={"ETag": 'W/"abc"'})
+        httpx_mock.add_response(status_code=304)
+        first = revalidating_client.tasks.get(123)
+        second = revalidating_client.tasks.get(123)
+        assert second == first
+        assert second is not first
+
+        first_request, second_request = httpx_mock.get_requests()
+        assert "If-None-Match" not in first_request.headers
+        assert second_request.headers["If-None-Match"] == 'W/"abc"'
+
+    def test_not_modified_result_is_not_shared(
+        self,
+        revalidating_client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_task_response: dict,
+    ) -> None:
+        """Test that mutating one result doesn't affect the next revalidated get()."""
+        httpx_mock.add_response(json=mock_task_response, headers={"ETag": 'W/"abc"'})
+        httpx_mock.add_response(status_code=304, is_reusable=True)
+        revalidating_client.tasks.get(123).title = "changed"
+        revalidating_client.tasks.get(123).title = "changed again"
+        assert revalidating_client.tasks.get(123).title == mock_task_response["data"]["title"]
+
+    async def test_context_async_reuses_context_on_not_modified(
+        self,
+        revalidating_client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_task_response: dict,
+    ) -> None:
+        """Test that context_async() revalidates with the stored ETag."""
+        context_data = {"success": True, "data": {"task": mock_task_response["data"]}}
+        httpx_mock.add_response(json=context_data, headers={"ETag": 'W/"ctx"'})
+        httpx_mock.add_response(status_code=304)
+        first = await revalidating_client.tasks.context_async(123)
+        assert await revalidating_client.tasks.context_async(123) == first
+        assert httpx_mock.get_requests()[1].headers["If-None-Match"] == 'W/"ctx"'
+
+    def test_get_is_not_conditional_by_default(
+        self, client: CavendoClient, httpx_mock: HTTPXMock, mock_task_response: dict
+    ) -> None:
+        """Test that ETags are not remembered unless revalidation is enabled."""
+        httpx_mock.add_response(
+            json=mock_task_response, headers={"ETag": 'W/"abc"'}, is_reusable=True
+        )
+        client.tasks.get(123)
+        client.tasks.get(123)
+        assert all("If-None-Match" not in r.headers for r in httpx_mock.get_requests())
+
+    def test_get_without_etag_is_not_conditional(
+        self,
+        revalidating_client: CavendoClient,
+        httpx_mock: HTTPXMock,
+        mock_task_response: dict,
+    ) -> None:
+        """Test that responses without an ETag are always fetched in full."""
+        httpx_mock.add_response(json=mock_task_response, is_reusable=True)
+        revalidating_client.tasks.get(123)
+        revalidating_client.tasks.get(123)
+        assert all("If-None-Match" not in r.headers for r in httpx_mock.get_requests())
+
+    def test_etag_store_evicts_least_recently_used(self) -> None:
+        """Test that the bounded store drops the entry read least recently."""
+        cache: TTLCache[int, str] = TTLCache(float("inf"), maxsize=2)
+        cache.set(1, "a")
+        cache.set(2, "b")
+        assert cache.get(1) == "a"
+        cache.set(3, "c")
+        assert cache.get(2) is None
+        assert cache.get(1) == "a"
+        assert cache.get(3) == "c"
+
+
+class TestTasksLogProgress:
+    """Tests for tasks.log_progress() method."""
+
+    def test_log_progress_accepts_dataclass_details(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that a dataclass details payload is sent as a JSON object."""
+
+        @dataclass
+        class Details:
+            sections_complete: list[str]
+
+        httpx_mock.add_response(json={"success": True, "data": {"id": 1}})
+        client.tasks.log_progress(123, "Draft", percent_complete=70, details=Details(["intro"]))
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert json.loads(request.content) == {
+            "message": "Draft",
+            "percentComplete": 70,
+            "details": {"sections_complete": ["intro"]},
+        }
+
+
+class TestTasksProgressBuffer:
+    """Tests for the buffered log_progress_nowait()/flush_progress() methods."""
+
+    async def test_flush_sends_queued_entries_in_order(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that queued entries are all sent, in order per task."""
+        httpx_mock.add_response(json={"success": True, "data": {"id": 1}}, is_reusable=True)
+        client.tasks.start_progress_buffer(flush_interval=10)
+        for i in range(3):
+            client.tasks.log_progress_nowait(123, f"step {i}")
+        client.tasks.log_progress_nowait(456, "other", percent_complete=50)
+        await client.tasks.flush_progress()
+
+        requests = httpx_mock.get_requests()
+        assert len(requests) == 4
+        task_123 = [json.loads(r.content)["message"] for r in requests if "/123/" in r.url.path]
+        assert task_123 == ["step 0", "step 1", "step 2"]
+
+    async def test_flush_raises_delivery_error(
+        self, client: CavendoClient, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test that a failed background send is raised from flush_progress()."""
+        httpx_mock.add_response(status_code=404, json={"error": "Task not found"})
+        client.tasks.start_progress_buffer()
+        client.tasks.log_progress_nowait(999, "lost")
+        with pytest.raises(NotFoundError):
+            await client.tasks.flush_progress()
+
+    def test_nowait_requires_buffer(self, client: CavendoClient) -> None:
+        """Test that log_progress_nowait() fails without a running buffer."""
+        with pytest.raises(RuntimeError):
+            client.tasks.log_progress_nowait(123, "step")
@@ -1,15 +1,23 @@
 """Tests for the types module (dataclasses)."""
 
+import dataclasses
+import pickle
+import sys
+from datetime import datetime, timezone
+from typing import Optional
+
 import pytest
 
 from cavendo.types import (
     Agent,
+    AgentProfile,
     ContentType,
     Deliverable,
     DeliverableStatus,
     Feedback,
     KnowledgeDocument,
     SearchResult,
+    SprintInfo,
     Task,
     TaskContext,
     TaskStatus,
@@ -50,6 +58,195 @@ class TestAgentFromDict:
         assert agent.project_ids == []
         assert agent.metadata == {}
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_uses_slots(self) -> None:
+        """Test that Agent instances are slotted (no per-instance __dict__)."""
+        agent = Agent.from_dict({"id": 1, "name": "Test Agent"})
+        assert not hasattr(agent, "__dict__")
+
+
+class TestTypeSlots:
+    """Tests for slotted result types."""
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    @pytest.mark.parametrize(
+        "instance",
+        [
+            Task(id=1, title="Task"),
+            Deliverable(id=1),
+            KnowledgeDocument(id=1, title="Doc", content=""),
+            SearchResult(document=KnowledgeDocument(id=1, title="Doc", content="")),
+            Webhook(id=1, url="https://example.com/hook"),
+            Agent(id=1, name="Agent", type="custom"),
+            AgentProfile(id=1, name="Agent"),
+            SprintInfo(id=1, name="Sprint"),
+            Feedback(id=1, deliverable_id=1, content="", status=DeliverableStatus.APPROVED),
+        ],
+    )
+    def test_types_use_slots(self, instance: object) -> None:
+        """Test that result types are slotted."""
+        assert not hasattr(instance, "__dict__")
+
+
+class TestFromDictFieldOrder:
+    """Tests that the positional from_dict() constructors map every field correctly."""
+
+    def test_task_fields(self) -> None:
+        """Test that each Task field receives its own response value."""
+        task = Task.from_dict(
+            {
+                "id": 1,
+                "title": "title",
+                "description": "description",
+                "status": "review",
+                "priority": 2,
+                "projectId": 3,
+                "projectName": "project_name",
+                "assigneeId": 4,
+                "dueDate": "2025-01-01T00:00:00Z",
+                "progress": {"p": 1},
+                "metadata": {"m": 1},
+                "createdAt": "2025-01-02T00:00:00Z",
+                "updatedAt": "2025-01-03T00:00:00Z",
+            }
+        )
+        assert (task.id, task.title, task.description) == (1, "title", "description")
+        assert (task.status, task.priority) == (TaskStatus.REVIEW, 2)
+        assert (task.project_id, task.project_name, task.assignee_id) == (3, "project_name", 4)
+        assert (task.progress, task.metadata) == ({"p": 1}, {"m": 1})
+        assert (task.due_date, task.created_at, task.updated_at) == (
+            datetime(2025, 1, 1, tzinfo=timezone.utc),
+            datetime(2025, 1, 2, tzinfo=timezone.utc),
+            datetime(2025, 1, 3, tzinfo=timezone.utc),
+        )
+
+    def test_deliverable_fields(self) -> None:
+        """Test that each Deliverable field receives its own response value."""
+        names = [f.name for f in dataclasses.fields(Deliverable)]
+        deliverable = Deliverable.from_dict(
+            {
+                "id": 1,
+                "taskId": 2,
+                "title": "title",
+                "content": "content",
+                "contentType": "code",
+                "status": "approved",
+                "version": 3,
+                "metadata": {"m": 1},
+                "feedback": "feedback",
+                "summary": "summary",
+                "files": [{"filename": "f"}],
+                "actions": [{"action_text": "a"}],
+                "projectId": 4,
+                "agentId": 5,
+                "inputTokens": 6,
+                "outputTokens": 7,
+                "provider": "provider",
+                "model": "model",
+                "createdAt": "2025-01-02T00:00:00Z",
+                "updatedAt": "2025-01-03T00:00:00Z",
+            }
+        )
+        expected = {
+            "id": 1,
+            "task_id": 2,
+            "title": "title",
+            "content": "content",
+            "content_type": ContentType.CODE,
+            "status": DeliverableStatus.APPROVED,
+            "version": 3,
+            "metadata": {"m": 1},
+            "feedback": "feedback",
+            "summary": "summary",
+            "files": [{"filename": "f"}],
+            "actions": [{"action_text": "a"}],
+            "project_id": 4,
+            "agent_id": 5,
+            "input_tokens": 6,
+            "output_tokens": 7,
+            "provider": "provider",
+            "model": "model",
+        }
+        assert {name: getattr(deliverable, name) for name in names[:-2]} == expected
+        assert (deliverable.created_at, deliverable.updated_at) == (
+            datetime(2025, 1, 2, tzinfo=timezone.utc),
+            datetime(2025, 1, 3, tzinfo=timezone.utc),
+        )
+
+    def test_knowledge_document_fields(self) -> None:
+        """Test that each KnowledgeDocument field receives its own response value."""
+        doc = KnowledgeDocument.from_dict(
+            {
+                "id": 1,
+                "title": "title",
+                "content": "content",
+                "contentType": "html",
+                "projectId": 2,
+                "tags": ["t"],
+                "metadata": {"m": 1},
+                "createdAt": "2025-01-02T00:00:00Z",
+                "updatedAt": "2025-01-03T00:00:00Z",
+            }
+        )
+        assert (doc.id, doc.title, doc.content) == (1, "title", "content")
+        assert doc.content_type == ContentType.HTML
+        assert (doc.project_id, doc.tags, doc.metadata) == (2, ["t"], {"m": 1})
+        assert (doc.created_at, doc.updated_at) == (
+            datetime(2025, 1, 2, tzinfo=timezone.utc),
+            datetime(2025, 1, 3, tzinfo=timezone.utc),
+        )
+
+    def test_agent_fields(self) -> None:
+        """Test that each Agent field receives its own response value."""
+        agent = Agent.from_dict(
+            {
+                "id": 1,
+                "name": "name",
+                "type": "human",
+                "scopes": ["s"],
+                "projectIds": [2],
+                "metadata": {"m": 1},
+                "createdAt": "2025-01-02T00:00:00Z",
+            }
+        )
+        assert (agent.id, agent.name, agent.type) == (1, "name", "human")
+        assert (agent.scopes, agent.project_ids, agent.metadata) == (["s"], [2], {"m": 1})
+        assert agent.created_at == datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+    def test_feedback_fields(self) -> None:
+        """Test that each Feedback field receives its own response value."""
+        feedback = Feedback.from_dict(
+            {
+                "id": 1,
+                "deliverableId": 2,
+                "content": "content",
+                "status": "rejected",
+                "reviewerId": 3,
+                "reviewerName": "reviewer_name",
+                "createdAt": "2025-01-02T00:00:00Z",
+            }
+        )
+        assert (feedback.id, feedback.deliverable_id, feedback.content) == (1, 2, "content")
+        assert feedback.status == DeliverableStatus.REJECTED
+        assert (feedback.reviewer_id, feedback.reviewer_name) == (3, "reviewer_name")
+        assert feedback.created_at == datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+    def test_webhook_fields(self) -> None:
+        """Test that each Webhook field receives its own response value."""
+        webhook = Webhook.from_dict(
+            {
+                "id": 1,
+                "url": "url",
+                "events": ["task.assigned"],
+                "status": "inactive",
+                "secret": "secret",
+                "createdAt": "2025-01-02T00:00:00Z",
+            }
+        )
+        assert (webhook.id, webhook.url, webhook.events) == (1, "url", ["task.assigned"])
+        assert (webhook.active, webhook.secret) == (False, "secret")
+        assert webhook.created_at == datetime(2025, 1, 2, tzinfo=timezone.utc)
+
 
 class TestTaskFromDict:
     """Tests for Task.from_dict()."""
@@ -79,6 +276,98 @@ class TestTaskFromDict:
         assert task.project_id == 1
         assert task.assignee_id == 1
 
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2025-01-01T12:30:00Z", datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)),
+            ("2025-01-01T12:30:00+00:00", datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc)),
+            ("2025-01-01 12:30:00", datetime(2025, 1, 1, 12, 30)),
+            ("not a date", None),
+            (None, None),
+        ],
+    )
+    def test_from_dict_parses_timestamps(
+        self, value: Optional[str], expected: Optional[datetime]
+    ) -> None:
+        """Test that UTC "Z", offset, SQLite and invalid timestamps are handled."""
+        assert Task.from_dict({"id": 1, "title": "T", "createdAt": value}).created_at == expected
+
+
+class TestTaskContextFromDict:
+    """Tests for TaskContext.from_dict()."""
+
+    def test_lists_are_parsed_on_first_access(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that reading task/project doesn't parse knowledge or deliverables."""
+        data = {
+            "task": {"id": 1, "title": "T"},
+            "project": {"id": 5, "name": "P"},
+            "knowledge": [{"id": 7, "title": "Doc", "content": "..."}],
+            "previousDeliverables": [{"id": 9, "title": "Draft"}],
+        }
+        monkeypatch.setattr(KnowledgeDocument, "from_dicts", pytest.fail)
+        context = TaskContext.from_dict(data)
+        assert context.task.id == 1
+        assert context.project == {"id": 5, "name": "P"}
+
+        monkeypatch.undo()
+        assert [k.id for k in context.knowledge] == [7]
+        assert context.knowledge is context.knowledge
+        assert [d.id for d in context.previous_deliverables] == [9]
+        assert context.related_tasks == []
+
+    def test_equals_eagerly_built_context(self) -> None:
+        """Test that a lazily parsed context compares equal to one built directly."""
+        data = {"task": {"id": 1, "title": "T"}, "relatedTasks": [{"id": 2, "title": "R"}]}
+        expected = TaskContext(
+            task=Task.from_dict(data["task"]),
+            related_tasks=[Task.from_dict({"id": 2, "title": "R"})],
+        )
+        assert TaskContext.from_dict(data) == expected
+
+    def test_is_a_dataclass(self) -> None:
+        """Test that replace() and asdict() work and parse the lazy lists."""
+        data = {
+            "task": {"id": 1, "title": "T"},
+            "knowledge": [{"id": 7, "title": "D", "content": ""}],
+        }
+        context = TaskContext.from_dict(data)
+        assert dataclasses.is_dataclass(context)
+        assert [f.name for f in dataclasses.fields(context)] == [
+            "task",
+            "agent",
+            "project",
+            "sprint",
+            "related_tasks",
+            "knowledge",
+            "previous_deliverables",
+        ]
+
+        replaced = dataclasses.replace(context, project={"id": 5})
+        assert replaced.project == {"id": 5}
+        assert [k.id for k in replaced.knowledge] == [7]
+
+        as_dict = dataclasses.asdict(context)
+        assert as_dict["knowledge"][0]["id"] == 7
+        assert as_dict["related_tasks"] == []
+        assert "_raw" not in as_dict
+
+        restored = pickle.loads(pickle.dumps(context))
+        assert restored == context
+
+    def test_list_fields_have_list_annotations(self) -> None:
+        """Test that the lazy fields report their list types, not the descriptor."""
+        types = {f.name: f.type for f in dataclasses.fields(TaskContext)}
+        assert types["related_tasks"] == list[Task]
+        assert types["knowledge"] == list["KnowledgeDocument"]
+        assert types["previous_deliverables"] == list["Deliverable"]
+
+    def test_omitted_lists_default_to_empty(self) -> None:
+        """Test that a hand-built context without lists reads them as empty."""
+        context = TaskContext(task=Task(id=1, title="T"))
+        assert context.related_tasks == []
+        assert context.knowledge == []
+        assert context.previous_deliverables == []
+
 
 class TestDeliverableFromDict:
     """Tests for Deliverable.from_dict()."""
@@ -103,6 +392,54 @@ class TestDeliverableFromDict:
         assert deliverable.task_id == 123
         assert deliverable.content_type == ContentType.MARKDOWN
 
+    def test_from_dicts_falls_back_on_unknown_enums(self) -> None:
+        """Test Deliverable.from_dicts() parses a page and tolerates unknown values."""
+        deliverables = Deliverable.from_dicts(
+            [
+                {"id": 1, "title": "A", "contentType": "html", "status": "approved"},
+                {"id": 2, "title": "B", "contentType": "pdf", "status": "archived"},
+            ]
+        )
+        assert [d.id for d in deliverables] == [1, 2]
+        assert deliverables[0].content_type == ContentType.HTML
+        assert deliverables[0].status == DeliverableStatus.APPROVED
+        assert deliverables[1].content_type == ContentType.MARKDOWN
+        assert deliverables[1].status == DeliverableStatus.PENDING
+
+    def test_from_dict_keeps_falsy_values(self) -> None:
+        """Test that a present zero value isn't replaced by its snake_case alias or None."""
+        deliverable = Deliverable.from_dict(
+            {"id": 1, "title": "A", "inputTokens": 0, "outputTokens": 0, "output_tokens": 9}
+        )
+        assert deliverable.input_tokens == 0
+        assert deliverable.output_tokens == 0
+
+    def test_from_dict_accepts_snake_case(self) -> None:
+        """Test that snake_case keys are used when the camelCase key is absent."""
+        deliverable = Deliverable.from_dict(
+            {"id": 1, "title": "A", "task_id": 5, "content_type": "code", "input_tokens": 3}
+        )
+        assert deliverable.task_id == 5
+        assert deliverable.content_type == ContentType.CODE
+        assert deliverable.input_tokens == 3
+
+    def test_from_dicts_shares_provider_and_model_strings(self) -> None:
+        """Test that repeated provider/model values are interned across rows."""
+        rows = [
+            {
+                "id": i,
+                "taskId": 1,
+                "title": "Row",
+                "provider": "".join(["open", "ai"]),
+                "model": "".join(["gpt-", "4o"]),
+            }
+            for i in range(2)
+        ]
+        first, second = Deliverable.from_dicts(rows)
+        assert first.provider == "openai"
+        assert first.provider is second.provider
+        assert first.model is second.model
+
 
 class TestFeedbackFromDict:
     """Tests for Feedback.from_dict()."""
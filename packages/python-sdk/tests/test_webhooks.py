@@ -1,5 +1,7 @@
 """Tests for the WebhooksAPI class."""
 
+import json
+
 import pytest
 from pytest_httpx import HTTPXMock
 
@@ -68,6 +70,8 @@ class TestWebhooksCreate:
         )
         request = httpx_mock.get_request()
         assert request is not None
+        body = json.loads(request.content)
+        assert body["events"] == ["task.assigned", "deliverable.approved"]
 
 
 class TestWebhooksUpdate:
@@ -77,8 +81,7 @@ class TestWebhooksUpdate:
         self, client: CavendoClient, httpx_mock: HTTPXMock, mock_webhook_response: dict
     ) -> None:
         """Test that update() returns the updated Webhook."""
-        updated = mock_webhook_response.copy()
-        updated["data"]["active"] = False
+        updated = {"success": True, "data": {**mock_webhook_response["data"], "active": False}}
         httpx_mock.add_response(json=updated)
         webhook = client.webhooks.update(1, active=False)
         assert isinstance(webhook, Webhook)
@@ -96,6 +99,10 @@ class TestWebhooksUpdate:
         )
         request = httpx_mock.get_request()
         assert request is not None
+        assert json.loads(request.content) == {
+            "url": "https://new-url.com/webhook",
+            "events": ["task.completed"],
+        }
 
 
 class TestWebhooksDelete: